@@ -81,6 +81,11 @@ Examples:
         action="store_true",
         help="Clean temporary files and cache (developer mode)",
     )
+    parser.add_argument(
+        "--no-clean",
+        action="store_true",
+        help="With --build, skip cleaning temporary files first",
+    )
 
     return parser.parse_args()
 
@@ -106,7 +111,7 @@ def main():
             sys.exit(0 if success else 1)
 
         if args.build:
-            success = build_zipapp()
+            success = build_zipapp(clean=not args.no_clean)
             sys.exit(0 if success else 1)
 
         if args.clean_files:
@@ -11,7 +11,9 @@ APP_VERSION = "1.0.0"
 
 # File paths
 CONFIG_FILE = os.path.expanduser("./.orders_config.json")
-ORDERS_HISTORY_FILE = os.path.expanduser("./.orders_history.json")
+ORDERS_HISTORY_FILE = os.path.expanduser("./.orders_history.jsonl")
+# JSON array history written by older versions, migrated on first load
+LEGACY_ORDERS_HISTORY_FILE = os.path.expanduser("./.orders_history.json")
 
 
 class OrderMode:
@@ -6,9 +6,16 @@ import time
 from typing import Dict, Any
 
 from models.config import Config
-from ui.utils import get_screen_size, draw_border, write_text, show_status
+from ui.utils import (
+    get_screen_size,
+    draw_border,
+    write_text,
+    show_status,
+    hline,
+    ATTR,
+)
 from ui.dialog import display_dialog
-from config.constants import Colors, Symbols
+from config.constants import Colors
 
 
 class ConfigController:
@@ -45,7 +52,7 @@ class ConfigController:
                 dialog_y + 2,
                 dialog_x + 2,
                 info_text,
-                curses.color_pair(Colors.HEADER) | curses.A_BOLD,
+                ATTR["header_bold"],
             )
 
             # Separator line for visual separation
@@ -53,8 +60,8 @@ class ConfigController:
             stdscr.addstr(
                 separator_y,
                 dialog_x + 1,
-                Symbols.HORIZONTAL_LINE * (dialog_width - 2),
-                curses.color_pair(Colors.BORDER),
+                hline(dialog_width - 2),
+                ATTR["border"],
             )
 
             # Input prompt
@@ -64,7 +71,7 @@ class ConfigController:
                 dialog_y + 5,
                 dialog_x + 2,
                 input_label,
-                curses.color_pair(Colors.TEXT),
+                ATTR["text"],
             )
 
             # Separator line for visual separation
@@ -72,8 +79,8 @@ class ConfigController:
             stdscr.addstr(
                 separator_y,
                 dialog_x + 1,
-                Symbols.HORIZONTAL_LINE * (dialog_width - 2),
-                curses.color_pair(Colors.BORDER),
+                hline(dialog_width - 2),
+                ATTR["border"],
             )
 
             instructions = "[ENTER] Save • [Ctrl+C] Cancel • Leave empty to use environment variable"
@@ -83,7 +90,7 @@ class ConfigController:
                 dialog_y + 9,
                 dialog_x + 2,
                 instructions,
-                curses.color_pair(Colors.INFO) | curses.A_DIM,
+                ATTR["info_dim"],
             )
 
             # Input field background
@@ -95,7 +102,7 @@ class ConfigController:
                 input_y,
                 input_x,
                 " " * input_width,
-                curses.color_pair(Colors.INPUT_BG),
+                ATTR["input_bg"],
             )
 
         except curses.error:
@@ -12,6 +12,7 @@ from models.order_sender import (
     get_order_type_from_xml,
 )
 from models.history import History
+from models.database import Database
 from config.constants import ORDER_TYPES, OrderMode, SERVER_TYPES, ServerType, Colors
 from config.defaults import FIELD_ORDER
 from ui.utils import (
@@ -21,6 +22,7 @@ from ui.utils import (
     center_string,
     draw_border,
     show_status,
+    ATTR,
 )
 from ui.menu import display_menu, display_sectioned_menu
 from ui.dialog import display_dialog, prompt_input
@@ -57,7 +59,13 @@ class MainController:
             self.config_manager.save(config)
 
         # Start main menu
-        self._display_main_menu(stdscr, config)
+        try:
+            self._display_main_menu(stdscr, config)
+        finally:
+            # Flush pending history writes and release connections
+            History.commit()
+            Database.close_all()
+            OrderSender.shutdown()
 
     def _intro_menu(self, stdscr, config: Dict[str, Any]) -> None:
         """Display the introductory setup menu."""
@@ -458,7 +466,7 @@ class MainController:
                 dialog_y + 2,
                 dialog_x + 2,
                 preview_text,
-                curses.color_pair(Colors.HEADER) | curses.A_BOLD,
+                ATTR["header_bold"],
             )
 
             # Display XML content (simplified)
@@ -472,7 +480,7 @@ class MainController:
                         dialog_y + 3 + i,
                         dialog_x + 3,
                         line[: dialog_width - 6],  # Truncate long lines
-                        curses.color_pair(Colors.TEXT),
+                        ATTR["text"],
                     )
 
             # Warning message
@@ -483,7 +491,7 @@ class MainController:
                 dialog_y + dialog_height - 6,
                 dialog_x + 2,
                 warning_centered,
-                curses.color_pair(Colors.WARNING) | curses.A_BOLD,
+                ATTR["warning_bold"],
             )
 
             # Instructions
@@ -494,7 +502,7 @@ class MainController:
                 dialog_y + dialog_height - 4,
                 dialog_x + 2,
                 instructions_centered,
-                curses.color_pair(Colors.INFO),
+                ATTR["info"],
             )
 
         except curses.error:
@@ -12,15 +12,42 @@ from ui.utils import (
     show_status,
     truncate_text,
     center_string,
+    hline,
+    update_screen,
+    ATTR,
 )
 from ui.form import edit_form
 
+# Seconds a transient status message stays in the line editors' status bar
+_STATUS_SECONDS = 2.0
+
 
 class OrderController:
     """Controller for order creation and editing operations."""
 
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
+        # Transient (message, status_type, expiry) shown by the line editors
+        self._status = None
+
+    def _set_status(self, message: str, status_type: str) -> None:
+        """Show a status message in the line editors until it expires."""
+        self._status = (message, status_type, time.monotonic() + _STATUS_SECONDS)
+
+    def _active_status(self) -> Optional[tuple]:
+        """Get the current status message, dropping it once it has expired."""
+        if self._status is not None and time.monotonic() >= self._status[2]:
+            self._status = None
+        return self._status
+
+    def _read_key(self, stdscr) -> int:
+        """Read a key, waking up when the current status message expires."""
+        if self._status is not None:
+            remaining = self._status[2] - time.monotonic()
+            stdscr.timeout(max(1, int(remaining * 1000)))
+        key = stdscr.getch()
+        stdscr.timeout(-1)
+        return key
 
     def edit_pick_lines(
         self, stdscr, mode: str, lines: List[Dict], values: List[Dict]
@@ -30,7 +57,7 @@ class OrderController:
         height, width = get_screen_size(stdscr)
 
         while True:
-            stdscr.clear()
+            stdscr.erase()
 
             max_line_len = (
                 max(
@@ -71,7 +98,7 @@ class OrderController:
                     instructions_y,
                     box_x + 2,
                     instructions_centered,
-                    curses.color_pair(Colors.SUCCESS) | curses.A_BOLD,
+                    ATTR["success_bold"],
                 )
 
                 # Visual separator for better organization
@@ -79,8 +106,8 @@ class OrderController:
                 stdscr.addstr(
                     separator_y,
                     box_x + 1,
-                    Symbols.HORIZONTAL_LINE * (box_width - 2),
-                    curses.color_pair(Colors.BORDER),
+                    hline(box_width - 2),
+                    ATTR["border"],
                 )
 
                 # Order summary with key metrics
@@ -96,7 +123,7 @@ class OrderController:
                     summary_y,
                     box_x + 2,
                     order_info_centered,
-                    curses.color_pair(Colors.INFO) | curses.A_BOLD,
+                    ATTR["info_bold"],
                 )
 
                 # Display lines
@@ -122,44 +149,32 @@ class OrderController:
 
                     line_str = truncate_text(line_str, box_width - 12)
 
+                    # Write the whole row once, then recolor the arrow and
+                    # line number in place
+                    row_y = lines_start_y + i
                     if i == idx:
                         # Enhanced highlighting for selected line
                         try:
                             stdscr.addstr(
-                                lines_start_y + i,
+                                row_y,
                                 box_x + 2,
-                                f"{Symbols.ARROW_RIGHT}",
-                                curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
-                            )
-                            stdscr.addstr(
-                                lines_start_y + i,
-                                box_x + 4,
-                                line_num,
-                                curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
-                            )
-                            stdscr.addstr(
-                                lines_start_y + i,
-                                box_x + 7,
-                                f". {line_str}",
-                                curses.color_pair(Colors.WARNING) | curses.A_BOLD,
+                                f"{Symbols.ARROW_RIGHT} {line_num} . {line_str}",
+                                ATTR["warning_bold"],
                             )
+                            stdscr.chgat(row_y, box_x + 2, 1, ATTR["selected_bold"])
+                            stdscr.chgat(row_y, box_x + 4, 2, ATTR["selected_bold"])
                         except curses.error:
                             pass
                     else:
                         # Normal line with subtle hierarchy
                         try:
                             stdscr.addstr(
-                                lines_start_y + i,
+                                row_y,
                                 box_x + 4,
-                                line_num,
-                                curses.color_pair(Colors.INFO),
-                            )
-                            stdscr.addstr(
-                                lines_start_y + i,
-                                box_x + 7,
-                                f". {line_str}",
-                                curses.color_pair(Colors.TEXT),
+                                f"{line_num} . {line_str}",
+                                ATTR["text"],
                             )
+                            stdscr.chgat(row_y, box_x + 4, 2, ATTR["info"])
                         except curses.error:
                             pass
 
@@ -169,8 +184,8 @@ class OrderController:
                 stdscr.addstr(
                     footer_y - 1,
                     box_x + 1,
-                    Symbols.HORIZONTAL_LINE * (box_width - 2),
-                    curses.color_pair(Colors.BORDER),
+                    hline(box_width - 2),
+                    ATTR["border"],
                 )
 
                 status_text = f"Line {idx + 1} of {len(lines)} selected • Total Lines: {len(lines)}"
@@ -179,15 +194,20 @@ class OrderController:
                     footer_y,
                     box_x + 2,
                     status_centered,
-                    curses.color_pair(Colors.SUCCESS) | curses.A_BOLD,
+                    ATTR["success_bold"],
                 )
 
             except curses.error:
                 pass
 
-            stdscr.refresh()
+            status = self._active_status()
+            if status is not None:
+                show_status(stdscr, status[0], status[1])
+
+            stdscr.noutrefresh()
+            update_screen()
 
-            key = stdscr.getch()
+            key = self._read_key(stdscr)
             if key in (curses.KEY_UP, ord("k")) and idx > 0:
                 idx -= 1
             elif key in (curses.KEY_DOWN, ord("j")) and idx < len(lines) - 1:
@@ -199,20 +219,14 @@ class OrderController:
                 )
                 lines.append(new_line)
                 idx = len(lines) - 1
-                show_status(stdscr, "New line added", "success")
-                stdscr.refresh()
-                time.sleep(0.3)
+                self._set_status("New line added", "success")
             elif key == ord("d") or key == ord("D"):
                 if len(lines) > 1:
                     del lines[idx]
                     idx = max(0, idx - 1)
-                    show_status(stdscr, "Line deleted", "warning")
-                    stdscr.refresh()
-                    time.sleep(0.3)
+                    self._set_status("Line deleted", "warning")
                 else:
-                    show_status(stdscr, "Cannot delete the last line", "error")
-                    stdscr.refresh()
-                    time.sleep(0.5)
+                    self._set_status("Cannot delete the last line", "error")
             elif key in (curses.KEY_ENTER, 10, 13, ord("l")):  # Enter
                 result = self._edit_single_line(stdscr, lines[idx], mode)
                 if result is True:
@@ -248,7 +262,7 @@ class OrderController:
         height, width = get_screen_size(stdscr)
 
         while True:
-            stdscr.clear()
+            stdscr.erase()
 
             # Enhanced dynamic box sizing for transport orders
             max_line_len = (
@@ -291,7 +305,7 @@ class OrderController:
                     instructions_y,
                     box_x + 2,
                     instructions_centered,
-                    curses.color_pair(Colors.SUCCESS) | curses.A_BOLD,
+                    ATTR["success_bold"],
                 )
 
                 # Visual separator
@@ -299,8 +313,8 @@ class OrderController:
                 stdscr.addstr(
                     separator_y,
                     box_x + 1,
-                    Symbols.HORIZONTAL_LINE * (box_width - 2),
-                    curses.color_pair(Colors.BORDER),
+                    hline(box_width - 2),
+                    ATTR["border"],
                 )
 
                 # Transport summary with key information
@@ -320,7 +334,7 @@ class OrderController:
                     summary_y,
                     box_x + 2,
                     summary_centered,
-                    curses.color_pair(Colors.INFO) | curses.A_BOLD,
+                    ATTR["info_bold"],
                 )
 
                 # Display slot lines with enhanced formatting
@@ -345,7 +359,7 @@ class OrderController:
                             lines_start_y + i,
                             box_x + 2,
                             arrow_text,
-                            curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
+                            ATTR["selected_bold"],
                         )
                     else:
                         # Normal slot
@@ -353,7 +367,7 @@ class OrderController:
                             lines_start_y + i,
                             box_x + 4,
                             slot_str,
-                            curses.color_pair(Colors.TEXT),
+                            ATTR["text"],
                         )
 
                 # Status info
@@ -362,22 +376,25 @@ class OrderController:
                     f"Slot {idx + 1} of {len(lines)} • {len(lines)} total slots"
                 )
                 status_centered = center_string(status_text, box_width - 4)
-                stdscr.addstr(
-                    status_y, box_x + 2, status_centered, curses.color_pair(Colors.INFO)
-                )
+                stdscr.addstr(status_y, box_x + 2, status_centered, ATTR["info"])
 
             except curses.error:
                 pass
 
             # Create status bar
-            show_status(
-                stdscr,
-                f"Editing Transport Order • Use arrow keys to navigate slots",
-                "info",
-            )
+            status = self._active_status()
+            if status is not None:
+                show_status(stdscr, status[0], status[1])
+            else:
+                show_status(
+                    stdscr,
+                    f"Editing Transport Order • Use arrow keys to navigate slots",
+                    "info",
+                )
 
-            stdscr.refresh()
-            key = stdscr.getch()
+            stdscr.noutrefresh()
+            update_screen()
+            key = self._read_key(stdscr)
 
             # Handle navigation
             if key in (curses.KEY_UP, ord("k")) and idx > 0:
@@ -393,9 +410,7 @@ class OrderController:
                 new_slot["Slot Number"] = str(len(lines) + 1)
                 lines.append(new_slot)
                 idx = len(lines) - 1
-                show_status(stdscr, "New slot added", "success")
-                stdscr.refresh()
-                time.sleep(0.3)
+                self._set_status("New slot added", "success")
             elif key in (ord("d"), ord("D")) and lines:  # Delete slot
                 if len(lines) > 1:
                     lines.pop(idx)
@@ -404,13 +419,9 @@ class OrderController:
                         line["Slot Number"] = str(i + 1)
                     if idx >= len(lines):
                         idx = len(lines) - 1
-                    show_status(stdscr, "Slot deleted", "warning")
-                    stdscr.refresh()
-                    time.sleep(0.3)
+                    self._set_status("Slot deleted", "warning")
                 else:
-                    show_status(stdscr, "Cannot delete the last slot", "error")
-                    stdscr.refresh()
-                    time.sleep(0.5)
+                    self._set_status("Cannot delete the last slot", "error")
             elif key in (curses.KEY_ENTER, 10, 13, ord("l")):  # Enter
                 result = self._edit_transport_slot(stdscr, lines[idx], mode, lines)
                 if result is True:
@@ -454,13 +465,10 @@ class OrderController:
                 # Apply new processing mode to all slots
                 for line in all_lines:
                     line["Processing Mode"] = new_processing_mode
-                show_status(
-                    stdscr,
+                self._set_status(
                     f"Processing mode '{new_processing_mode}' applied to all slots",
                     "success",
                 )
-                stdscr.refresh()
-                time.sleep(0.8)
             else:
                 slot.update(updated_values)  # Update only the changed fields
             return None  # Continue editing
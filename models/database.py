@@ -1,5 +1,6 @@
 """Database management for the OSR Order GUI."""
 
+import queue
 import time
 from typing import List, Tuple, Optional, Dict
 
@@ -10,10 +11,22 @@ except ImportError:
 
 from utils.exceptions import DatabaseConnectionError
 
+# Maximum number of idle connections kept per OSR ID
+_POOL_SIZE = 4
+# Seconds a cached lookup result stays valid
+_CACHE_TTL = 30
+# Seconds cached reference data (product catalog, container types) stays valid
+_REFERENCE_TTL = 300
+
 
 class Database:
     """Handles Oracle database connections and query operations."""
 
+    # Idle connections per OSR ID, shared by all instances
+    _pools = {}
+    # Lookup results keyed on (osrid, query, params) -> (timestamp, rows)
+    _query_cache = {}
+
     def __init__(self, osrid: str, retries: int = 3, delay: int = 2):
         self.osrid = osrid
         self.retries = retries
@@ -35,52 +48,141 @@ class Database:
                         f"Failed to connect to Oracle database after {self.retries} attempts: {e}"
                     )
 
+    def _pool(self) -> queue.Queue:
+        """Get the idle connection pool for this OSR ID."""
+        pool = Database._pools.get(self.osrid)
+        if pool is None:
+            # setdefault keeps the first pool if two threads get here at once
+            pool = Database._pools.setdefault(self.osrid, queue.Queue(_POOL_SIZE))
+        return pool
+
+    def _acquire(self) -> Tuple[object, bool]:
+        """Take an idle pooled connection, or open a new one.
+
+        Returns the connection and whether it came from the pool.
+        """
+        try:
+            return self._pool().get_nowait(), True
+        except queue.Empty:
+            return self.connect(), False
+
+    def _release(self, db) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._pool().put_nowait(db)
+        except queue.Full:
+            db.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all idle pooled connections."""
+        for pool in cls._pools.values():
+            while True:
+                try:
+                    db = pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    db.close()
+                except Exception:
+                    pass
+
     def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Tuple]:
         """Execute database query with error handling."""
         try:
-            db = self.connect()
-            cursor = db.cursor()
-            cursor.execute(query, params or {})
-            results = cursor.fetchall()
-            db.close()
-            return results
+            db, pooled = self._acquire()
         except Exception as e:
             raise DatabaseConnectionError(f"Database query error: {e}")
 
-    def get_products_for_pick(self) -> List[Tuple]:
-        """Get products available for picking orders."""
+        while True:
+            try:
+                cursor = db.cursor()
+                cursor.execute(query, params or {})
+                results = cursor.fetchall()
+                break
+            except Exception as e:
+                # Don't hand a possibly broken connection back to the pool
+                try:
+                    db.close()
+                except Exception:
+                    pass
+                if not pooled:
+                    raise DatabaseConnectionError(f"Database query error: {e}")
+
+            # An idle pooled connection may have been dropped by the server
+            # or a firewall, so retry once on a fresh one
+            try:
+                db, pooled = self.connect(), False
+            except Exception as e:
+                raise DatabaseConnectionError(f"Database query error: {e}")
+
+        self._release(db)
+        return results
+
+    def cached_query(
+        self, query: str, params: Optional[Dict] = None, ttl: float = _CACHE_TTL
+    ) -> List[Tuple]:
+        """Execute a read-only query, reusing results younger than ttl seconds."""
+        key = (self.osrid, query, tuple(sorted((params or {}).items())))
+        cached = Database._query_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        results = self.execute_query(query, params)
+        Database._query_cache[key] = (time.monotonic(), results)
+        return results
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop all cached lookup results."""
+        cls._query_cache.clear()
+
+    def get_products_all(self) -> List[Tuple]:
+        """Get every product slot with unreserved stock for this OSR.
+
+        Rows are (pri_name, pri_code, unreserved, tray_id, slot_type), with
+        tray_id set to None for slots whose tray is not in the trays table.
+        """
         query = """
-            SELECT DISTINCT p.pri_name, p.pri_code, SUM(s.scnt_unreserved)
+            SELECT p.pri_name, p.pri_code, s.scnt_unreserved,
+                   t.tray_id, s.scnt_slot_type
             FROM slot_contents s
+            LEFT JOIN trays t ON s.scnt_slot_tray_id = t.tray_id
             JOIN product_infos p ON s.scnt_pri_id = p.pri_id
             WHERE s.scnt_slot_tray_osr_id = :osrid
             AND s.scnt_unreserved > 0
-            GROUP BY p.pri_name, p.pri_code
             ORDER BY p.pri_name
         """
-        return self.execute_query(query, {"osrid": self.osrid})
+        return self.cached_query(query, {"osrid": self.osrid})
+
+    def _split_products(self) -> Tuple[List[Tuple], List[Tuple]]:
+        """Derive the pick and inventory product lists in one pass."""
+        totals = {}
+        inventory = []
+        for name, code, unreserved, tray_id, slot_type in self.get_products_all():
+            totals[(name, code)] = totals.get((name, code), 0) + unreserved
+            if tray_id is not None:
+                inventory.append((name, code, tray_id, slot_type))
+
+        pick = [(name, code, total) for (name, code), total in totals.items()]
+        return pick, inventory
+
+    def get_products_for_pick(self) -> List[Tuple]:
+        """Get products available for picking orders."""
+        return self._split_products()[0]
 
     def get_products_for_inventory(self) -> List[Tuple]:
         """Get products available for inventory orders."""
-        query = """
-            SELECT p.pri_name, p.pri_code, s.scnt_slot_tray_id, s.scnt_slot_type
-            FROM slot_contents s
-            JOIN trays t ON s.scnt_slot_tray_id = t.tray_id
-            JOIN product_infos p ON s.scnt_pri_id = p.pri_id
-            WHERE s.scnt_slot_tray_osr_id = :osrid
-            AND s.scnt_unreserved > 0
-            ORDER BY p.pri_name
-        """
-        return self.execute_query(query, {"osrid": self.osrid})
+        return self._split_products()[1]
 
     def get_products_for_goods_in(self) -> List[Tuple]:
         """Get available products."""
         query = (
             "SELECT DISTINCT pri_name, pri_code FROM product_infos ORDER BY pri_name"
         )
-        return self.execute_query(query)
+        return self.cached_query(query, ttl=_REFERENCE_TTL)
 
     def get_container_types(self) -> List[Tuple]:
         """Get available container types for transport orders."""
         query = "SELECT cont_type_name FROM container_types ORDER BY cont_type_name"
-        return self.execute_query(query)
+        return self.cached_query(query, ttl=_REFERENCE_TTL)
@@ -2,42 +2,285 @@
 
 import json
 import os
+import queue
+import threading
 import time
-from typing import List, Dict
+from typing import List, Dict, Iterable
 
-from config.constants import ORDERS_HISTORY_FILE
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config.constants import ORDERS_HISTORY_FILE, LEGACY_ORDERS_HISTORY_FILE
+
+# Number of orders kept in history
+_MAX_ORDERS = 100
+# Rewrite the log once it grows past this many lines
+_COMPACT_AFTER = 200
+# Maximum number of queued entries written in one batch
+_BATCH_SIZE = 32
+# How long the writer waits for more entries before flushing a batch
+_BATCH_WAIT = 0.05
+# Statuses of orders that can still be cancelled
+_ACTIVE_STATUSES = frozenset({"sent", "processing", "pending"})
+
+# Parsed history keyed on the (mtime, size) of the file it was read from,
+# along with an order_id -> record index and the number of lines in the file
+_CACHE = {"key": None, "data": [], "index": {}, "lines": 0}
+_lock = threading.RLock()
+
+# Entries waiting to be appended by the background writer
+_writer_q = queue.Queue()
+_writer = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to a UTF-8 encoded JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Deserialize a JSON document from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _file_key(path: str) -> tuple:
+    """Build a cache key from the file's stat results."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _set_cache(key: tuple, orders: List[Dict[str, str]], lines: int) -> None:
+    """Replace the cached history and rebuild its order_id index."""
+    _CACHE["key"] = key
+    _CACHE["data"] = orders
+    # Iterate oldest first so the newest record wins for duplicate IDs
+    _CACHE["index"] = {order.get("order_id"): order for order in reversed(orders)}
+    _CACHE["lines"] = lines
+
+
+def _start_writer() -> None:
+    """Start the background history writer if it is not running."""
+    global _writer
+    if _writer is None or not _writer.is_alive():
+        _writer = threading.Thread(
+            target=_writer_loop, name="history-writer", daemon=True
+        )
+        _writer.start()
+
+
+def _writer_loop() -> None:
+    """Append queued history entries to the log in batches."""
+    while True:
+        batch = [_writer_q.get()]
+        try:
+            while len(batch) < _BATCH_SIZE:
+                batch.append(_writer_q.get(timeout=_BATCH_WAIT))
+        except queue.Empty:
+            pass
+
+        try:
+            History._write_batch(batch)
+        finally:
+            for _ in batch:
+                _writer_q.task_done()
 
 
 class History:
-    """Manages order history tracking and persistence."""
+    """Manages order history tracking and persistence.
+
+    History is stored as an append-only JSON-Lines log: one line per order
+    record, plus ``{"op": "update", ...}`` events for status changes which
+    are folded into the records when the log is read. New entries are
+    applied to the in-memory history immediately and written to disk by a
+    background thread; call ``commit()`` to wait for pending writes.
+    """
 
     @staticmethod
     def load() -> List[Dict[str, str]]:
-        """Load order history from file."""
+        """Load order history from file, newest first."""
+        with _lock:
+            key = _file_key(ORDERS_HISTORY_FILE)
+            if key == (0, 0) and History.migrate_legacy():
+                key = _file_key(ORDERS_HISTORY_FILE)
+            if key == _CACHE["key"]:
+                return list(_CACHE["data"])
+
+            lines = []
+            if key != (0, 0):
+                try:
+                    with open(ORDERS_HISTORY_FILE, "rb") as f:
+                        lines = f.readlines()
+                        st = os.fstat(f.fileno())
+                        key = (st.st_mtime_ns, st.st_size)
+                except IOError:
+                    return []
+
+            orders = History._fold(lines)
+            _set_cache(key, orders, len(lines))
+            if len(lines) > _COMPACT_AFTER:
+                History.save(orders)
+            return list(orders)
+
+    @staticmethod
+    def migrate_legacy() -> bool:
+        """Import the JSON array history left by older versions, once.
+
+        The old file is renamed to ``*.bak`` after its orders are written to
+        the new log, or to ``*.corrupt`` if it can't be parsed, so it is only
+        read once. Returns True if the log was created.
+        """
+        with _lock:
+            if not os.path.isfile(LEGACY_ORDERS_HISTORY_FILE):
+                return False
+            try:
+                with open(LEGACY_ORDERS_HISTORY_FILE, "rb") as f:
+                    data = f.read()
+            except OSError:
+                return False
+            try:
+                orders = _loads(data)
+            except ValueError:
+                orders = None
+
+            if not isinstance(orders, list):
+                History._set_legacy_aside(".corrupt")
+                return False
+
+            History.save([order for order in orders if isinstance(order, dict)])
+            if not os.path.exists(ORDERS_HISTORY_FILE):
+                return False
+            History._set_legacy_aside(".bak")
+            return True
+
+    @staticmethod
+    def _set_legacy_aside(suffix: str) -> None:
+        """Rename the legacy history file so it isn't migrated again."""
         try:
-            if os.path.exists(ORDERS_HISTORY_FILE):
-                with open(ORDERS_HISTORY_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            os.replace(LEGACY_ORDERS_HISTORY_FILE, LEGACY_ORDERS_HISTORY_FILE + suffix)
+        except OSError:
             pass
-        return []
+
+    @staticmethod
+    def _fold(lines: Iterable[bytes]) -> List[Dict[str, str]]:
+        """Replay log lines into a newest-first list of order records."""
+        orders = []
+        by_id = {}
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = _loads(line)
+            except ValueError:
+                continue  # Skip a torn trailing write
+
+            if entry.get("op") == "update":
+                order = by_id.get(entry.get("order_id"))
+                if order is not None:
+                    order["status"] = entry.get("status")
+                    order["updated"] = entry.get("updated")
+            else:
+                orders.append(entry)
+                by_id[entry.get("order_id")] = entry
+
+        orders.reverse()
+        return orders[:_MAX_ORDERS]
 
     @staticmethod
     def save(orders: List[Dict[str, str]]) -> None:
-        """Save order history to file."""
-        try:
-            with open(ORDERS_HISTORY_FILE, "w", encoding="utf-8") as f:
-                json.dump(orders, f, indent=2, ensure_ascii=False)
-        except IOError:
-            pass
+        """Rewrite the history log from a newest-first list of orders."""
+        orders = orders[:_MAX_ORDERS]
+        data = b"".join(_dumps(order) for order in reversed(orders))
+
+        # Write to a temporary file and swap it in so readers never see a
+        # partially written log
+        tmp_file = ORDERS_HISTORY_FILE + ".tmp"
+        with _lock:
+            try:
+                with open(tmp_file, "wb", buffering=0) as f:
+                    f.write(data)
+                os.replace(tmp_file, ORDERS_HISTORY_FILE)
+            except OSError:
+                _CACHE["key"] = None
+                return
+
+            _set_cache(_file_key(ORDERS_HISTORY_FILE), orders, len(orders))
+
+    @staticmethod
+    def _append(entry: Dict[str, str]) -> None:
+        """Apply an entry to the in-memory history and queue it for writing."""
+        with _lock:
+            History.load()  # Make sure the cache reflects the file
+            History._apply_entry(entry)
+            _writer_q.put(entry)
+        _start_writer()
+
+    @staticmethod
+    def _write_batch(entries: List[Dict[str, str]]) -> None:
+        """Append a batch of entries to the history log in a single write."""
+        data = b"".join(_dumps(entry) for entry in entries)
+
+        with _lock:
+            # Entries are already in the cache; only keep it valid if nobody
+            # else touched the file since it was read
+            cached = _file_key(ORDERS_HISTORY_FILE) == _CACHE["key"]
+            try:
+                with open(ORDERS_HISTORY_FILE, "ab", buffering=0) as f:
+                    f.write(data)
+            except OSError:
+                return
+
+            if not cached:
+                _CACHE["key"] = None
+                return
+
+            _CACHE["key"] = _file_key(ORDERS_HISTORY_FILE)
+            _CACHE["lines"] += len(entries)
+            # Queued entries are already in the cache, so only compact once
+            # they have all been written or they would be written twice
+            if _CACHE["lines"] > _COMPACT_AFTER and _writer_q.empty():
+                History.save(_CACHE["data"])
+
+    @staticmethod
+    def commit() -> None:
+        """Block until all pending history entries are written to disk."""
+        _writer_q.join()
+
+    @staticmethod
+    def _apply_entry(entry: Dict[str, str]) -> None:
+        """Apply a single log entry to the cached history."""
+        index = _CACHE["index"]
+
+        if entry.get("op") == "update":
+            order = index.get(entry.get("order_id"))
+            if order is not None:
+                order["status"] = entry.get("status")
+                order["updated"] = entry.get("updated")
+            return
+
+        order = dict(entry)
+        orders = [order] + _CACHE["data"]
+        for dropped in orders[_MAX_ORDERS:]:
+            if index.get(dropped.get("order_id")) is dropped:
+                del index[dropped.get("order_id")]
+        index[order.get("order_id")] = order
+        _CACHE["data"] = orders[:_MAX_ORDERS]
 
     @staticmethod
     def add_order(
         order_id: str, order_type: str, osrid: str, status: str = "sent"
     ) -> None:
         """Add new order to history."""
-        orders = History.load()
-
         order_record = {
             "order_id": order_id,
             "type": order_type,
@@ -46,22 +289,19 @@ class History:
             "created": time.strftime("%Y-%m-%d %H:%M:%S"),
         }
 
-        orders.insert(0, order_record)
-        orders = orders[:100]
-        History.save(orders)
+        History._append(order_record)
 
     @staticmethod
     def update_status(order_id: str, new_status: str) -> None:
         """Update order status in history."""
-        orders = History.load()
-
-        for order in orders:
-            if order.get("order_id") == order_id:
-                order["status"] = new_status
-                order["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
-                break
-
-        History.save(orders)
+        History._append(
+            {
+                "op": "update",
+                "order_id": order_id,
+                "status": new_status,
+                "updated": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        )
 
     @staticmethod
     def get_active_orders(osrid: str) -> List[Dict[str, str]]:
@@ -70,12 +310,7 @@ class History:
         return [
             order
             for order in orders
-            if (
-                order.get("osrid") == osrid
-                and order.get("status") in ["sent", "processing", "pending"]
-                and order.get("status")
-                not in ["cancelled", "cancelled_dry_run", "completed", "failed"]
-            )
+            if order.get("osrid") == osrid and order.get("status") in _ACTIVE_STATUSES
         ]
 
     @staticmethod
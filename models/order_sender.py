@@ -3,6 +3,7 @@
 import sys
 import subprocess
 import re
+import threading
 from typing import Tuple
 
 try:
@@ -15,31 +16,46 @@ try:
 except ImportError:
     CORBA_AVAILABLE = False
 
+from config.constants import OrderMode
+from models.database import Database
 from utils.exceptions import ORBConnectionError, OrderValidationError
 
+_ORDER_ID_RE = re.compile(r'order_number="([^"]+)"')
+# Matches the start of the main order element
+_ORDER_TAG_RE = re.compile(
+    r"<(transport_order|pick_order|goods_in_order|inventory_order)[ >]"
+)
+
 
 class OrderSender:
     """Handles sending orders via CORBA to OSR system."""
 
+    # ORB, naming context and per-OSR servants, shared by all senders
+    _orb = None
+    _root_context = None
+    _servants = {}
+    _lock = threading.Lock()
+
     def __init__(self, osrid: str, dry_run: bool = False):
         self.osrid = osrid
         self.dry_run = dry_run
 
-    def send(self, xml: str) -> None:
-        """Send order XML to OSR system via CORBA."""
-        if not xml or not xml.strip():
-            raise OrderValidationError("Order XML cannot be empty")
+    def _get_servant(self) -> Tuple[object, bool]:
+        """Resolve the Hio service port for this OSR ID, reusing earlier lookups.
 
-        if self.dry_run:
-            return
+        Returns the servant and whether it came from an earlier lookup.
+        """
+        with OrderSender._lock:
+            servant = OrderSender._servants.get(self.osrid)
+            if servant is not None:
+                return servant, True
 
-        if not CORBA_AVAILABLE:
-            raise ORBConnectionError("CORBA libraries not available")
-
-        try:
-            orb = CORBA.ORB_init(sys.argv, CORBA.ORB_ID)
-            obj = orb.resolve_initial_references("NameService")
-            rootContext = obj._narrow(CosNaming.NamingContext)
+            if OrderSender._orb is None:
+                OrderSender._orb = CORBA.ORB_init(sys.argv, CORBA.ORB_ID)
+            if OrderSender._root_context is None:
+                obj = OrderSender._orb.resolve_initial_references("NameService")
+                OrderSender._root_context = obj._narrow(CosNaming.NamingContext)
+            rootContext = OrderSender._root_context
 
             gcsName = [CosNaming.NameComponent("GCS", "")]
             gcs_obj = rootContext.resolve(gcsName)
@@ -57,12 +73,63 @@ class OrderSender:
             sobj = rootContext.resolve(name)
             servant = sobj._narrow(OSR.Hio.ServicePort)
 
+            OrderSender._servants[self.osrid] = servant
+            return servant, False
+
+    def _forget(self) -> None:
+        """Drop the cached servant and naming context so both are re-resolved."""
+        with OrderSender._lock:
+            OrderSender._servants.pop(self.osrid, None)
+            OrderSender._root_context = None
+
+    def send(self, xml: str) -> None:
+        """Send order XML to OSR system via CORBA."""
+        if not xml or not xml.strip():
+            raise OrderValidationError("Order XML cannot be empty")
+
+        if self.dry_run:
+            return
+
+        if not CORBA_AVAILABLE:
+            raise ORBConnectionError("CORBA libraries not available")
+
+        try:
+            servant, cached = self._get_servant()
+
             # Send the order
-            servant.sendOrder(xml)
+            try:
+                servant.sendOrder(xml)
+            except CORBA.SystemException as e:
+                # A cached reference goes stale when the NameService or the
+                # OSR restarts. Retry once on a fresh lookup, but only if the
+                # order is known not to have reached the server
+                if not cached or e.completed != CORBA.COMPLETED_NO:
+                    raise
+                self._forget()
+                servant, _ = self._get_servant()
+                servant.sendOrder(xml)
 
         except Exception as e:
+            # Re-resolve on the next send in case the reference went stale
+            self._forget()
             raise ORBConnectionError(f"Failed to send order: {e}")
 
+        # Stock levels change once an order is processed
+        Database.invalidate_cache()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Destroy the cached ORB and forget resolved servants."""
+        with cls._lock:
+            cls._servants.clear()
+            cls._root_context = None
+            if cls._orb is not None:
+                try:
+                    cls._orb.destroy()
+                except Exception:
+                    pass
+                cls._orb = None
+
 
 class OrderCanceller:
     """Handles order cancellation operations."""
@@ -71,20 +138,24 @@ class OrderCanceller:
         self.dry_run = dry_run
 
     def cancel_order(self, order_type: str, order_id: str) -> Tuple[bool, str]:
-        """Cancel an order using the shell command."""
+        """Cancel an order using the send_cancel command."""
         if self.dry_run:
             return True, "Dry run - order would be cancelled"
 
         try:
-            # Build the shell command using global send_cancel command
-            command = (
-                f"send_cancel --typ {order_type} --order-id {order_id} --really-send"
-            )
+            # Run the global send_cancel command directly, without a shell
+            command = [
+                "send_cancel",
+                "--typ",
+                order_type,
+                "--order-id",
+                order_id,
+                "--really-send",
+            ]
 
             # Execute the command
             result = subprocess.run(
                 command,
-                shell=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
@@ -107,33 +178,28 @@ class OrderCanceller:
 
 def extract_order_id_from_xml(xml_content: str) -> str:
     """Extract order ID from XML content."""
-    match = re.search(r'order_number="([^"]+)"', xml_content)
+    match = _ORDER_ID_RE.search(xml_content)
     return match.group(1) if match else "unknown"
 
 
 def get_order_type_from_xml(xml_content: str) -> str:
     """Extract order type from XML content and return proper OrderMode constant."""
-    from config.constants import OrderMode
-
-    # Make order type detection more robust by checking for main order elements
-    # Check more specific patterns first, then more general ones
-    # Use space or > to ensure we're matching actual element starts
+    # The tag pattern requires a space or > after the element name so that
+    # child elements such as <pick_order_line> are not matched
+    match = _ORDER_TAG_RE.search(xml_content)
+    if not match:
+        return "unknown"
 
-    if "<transport_order " in xml_content or "<transport_order>" in xml_content:
+    tag = match.group(1)
+    if tag == "transport_order":
         return OrderMode.TRANSPORT
-    elif "<pick_order " in xml_content or "<pick_order>" in xml_content:
+    elif tag == "pick_order":
         # Determine if it's standard or manual pick based on container presence
-        if "container_number=" in xml_content:
+        if xml_content.find("container_number=", match.end()) != -1:
             return OrderMode.PICK_STANDARD
-        else:
-            return OrderMode.PICK_MANUAL
-    elif (
-        "<goods_in_order " in xml_content and 'processing_mode="renewal"' in xml_content
-    ):
-        return OrderMode.GOODS_ADD
-    elif "<goods_in_order " in xml_content or "<goods_in_order>" in xml_content:
+        return OrderMode.PICK_MANUAL
+    elif tag == "goods_in_order":
+        if xml_content.find('processing_mode="renewal"', match.end()) != -1:
+            return OrderMode.GOODS_ADD
         return OrderMode.GOODS_IN
-    elif "<inventory_order " in xml_content or "<inventory_order>" in xml_content:
-        return OrderMode.INVENTORY
-    else:
-        return "unknown"
+    return OrderMode.INVENTORY
@@ -1,11 +1,40 @@
 """Sandbox command generation for test server operations."""
 
 import re
-import os
-import subprocess
 from typing import Optional, Dict, Any
 from enum import Enum
 
+# Simulator flags for element types
+_ELEM_TYPE_FLAG = {
+    "element": "e",
+    "station": "s",
+    "gateway": "g",
+    "e": "e",
+    "s": "s",
+    "g": "g",
+}
+
+_ORDER_ID_RE = re.compile(r'order_number="([^"]+)"')
+
+# Carrier patterns, most specific first
+_CARRIER_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r'container_number="([^"]+)"',  # container_number attribute (pick, transport)
+        r'compartment_number="([^"]+)"',  # compartment_number attribute (goods_in)
+        r'(?:container|tray|carrier)_id="([^"]+)"',  # Direct id attributes
+        r'<container[^>]*number="([^"]+)"',  # Container with number attribute
+        r'<tray[^>]*number="([^"]+)"',  # Tray with number attribute
+        r'<container[^>]*id="([^"]+)"',  # Container with id attribute
+        r'<tray[^>]*id="([^"]+)"',  # Tray with id attribute
+        r'<carrier[^>]*id="([^"]+)"',  # Carrier with id attribute
+        r"<container[^>]*>([^<]+)</container>",  # Container content
+        r"<tray[^>]*>([^<]+)</tray>",  # Tray content
+        r"<carrier[^>]*>([^<]+)</carrier>",  # Carrier content
+        r'id="([^"]+)".*(?:container|tray|carrier)',  # ID near container/tray/carrier
+    ]
+]
+
 
 class SandboxAction(Enum):
     """Available sandbox actions."""
@@ -24,52 +53,33 @@ class SandboxCommandGenerator:
         self.osrid = osrid.lower()
         if not self.osrid.startswith("osr"):
             self.osrid = f"osr{self.osrid}"
+        self._sim_prefix = f"sim{self.osrid}"
 
     def get_sim_prefix(self) -> str:
         """Get the simulator command prefix (e.g., 'simosr1', 'simosr2')."""
-        return f"sim{self.osrid}"
+        return self._sim_prefix
 
     def generate_insert_command(self, element: str, carrier: str) -> str:
         """Generate command to insert a carrier into an element."""
-        sim_prefix = self.get_sim_prefix()
-        return f"{sim_prefix} -i {element} {carrier}"
+        return f"{self._sim_prefix} -i {element} {carrier}"
 
     def generate_remove_command(self, element: str, carrier: str) -> str:
         """Generate command to remove a carrier from an element."""
-        sim_prefix = self.get_sim_prefix()
-        return f"{sim_prefix} -r {element} {carrier}"
+        return f"{self._sim_prefix} -r {element} {carrier}"
 
     def generate_enable_command(
         self, element: str, element_type: str = "element"
     ) -> str:
         """Generate command to enable an element, station, or gateway."""
-        sim_prefix = self.get_sim_prefix()
-        type_map = {
-            "element": "e",
-            "station": "s",
-            "gateway": "g",
-            "e": "e",
-            "s": "s",
-            "g": "g",
-        }
-        type_flag = type_map.get(element_type.lower(), "e")
-        return f"{sim_prefix} --enable-element {type_flag} {element}"
+        type_flag = _ELEM_TYPE_FLAG.get(element_type.lower(), "e")
+        return f"{self._sim_prefix} --enable-element {type_flag} {element}"
 
     def generate_disable_command(
         self, element: str, element_type: str = "element"
     ) -> str:
         """Generate command to disable an element, station, or gateway."""
-        sim_prefix = self.get_sim_prefix()
-        type_map = {
-            "element": "e",
-            "station": "s",
-            "gateway": "g",
-            "e": "e",
-            "s": "s",
-            "g": "g",
-        }
-        type_flag = type_map.get(element_type.lower(), "e")
-        return f"{sim_prefix} --disable-element {type_flag} {element}"
+        type_flag = _ELEM_TYPE_FLAG.get(element_type.lower(), "e")
+        return f"{self._sim_prefix} --disable-element {type_flag} {element}"
 
     def extract_carrier_from_xml(self, xml_content: str) -> Optional[str]:
         """Extract carrier/container/tray information from order XML for insertion commands.
@@ -81,26 +91,8 @@ class SandboxCommandGenerator:
             Carrier identifier if found, None otherwise
         """
         # Look for container/tray/carrier references in XML
-        # Prioritize most specific patterns first - focus on container_number, compartment_number
-        patterns = [
-            r'container_number="([^"]+)"',  # container_number attribute (pick, transport)
-            r'compartment_number="([^"]+)"',  # compartment_number attribute (goods_in)
-            r'container_id="([^"]+)"',  # Direct container_id attribute
-            r'tray_id="([^"]+)"',  # Direct tray_id attribute
-            r'carrier_id="([^"]+)"',  # Direct carrier_id attribute
-            r'<container[^>]*number="([^"]+)"',  # Container with number attribute
-            r'<tray[^>]*number="([^"]+)"',  # Tray with number attribute
-            r'<container[^>]*id="([^"]+)"',  # Container with id attribute
-            r'<tray[^>]*id="([^"]+)"',  # Tray with id attribute
-            r'<carrier[^>]*id="([^"]+)"',  # Carrier with id attribute
-            r"<container[^>]*>([^<]+)</container>",  # Container content
-            r"<tray[^>]*>([^<]+)</tray>",  # Tray content
-            r"<carrier[^>]*>([^<]+)</carrier>",  # Carrier content
-            r'id="([^"]+)".*(?:container|tray|carrier)',  # ID near container/tray/carrier
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, xml_content, re.IGNORECASE)
+        for pattern in _CARRIER_PATTERNS:
+            match = pattern.search(xml_content)
             if match:
                 carrier_id = match.group(1).strip()
                 # Skip empty or placeholder values
@@ -132,7 +124,7 @@ class SandboxCommandGenerator:
         carrier = self.extract_carrier_from_xml(xml_content)
         if not carrier:
             # Generate a default carrier ID based on order
-            order_id_match = re.search(r'order_number="([^"]+)"', xml_content)
+            order_id_match = _ORDER_ID_RE.search(xml_content)
             if order_id_match:
                 carrier = f"carrier_{order_id_match.group(1)}"
             else:
@@ -1,15 +1,67 @@
 """XML generation for OSR orders."""
 
-from typing import Dict, Any, List
+from collections import ChainMap
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 
 from config.constants import OrderMode
 from config.defaults import XML_TEMPLATES, LINE_TEMPLATES
 from utils.exceptions import OrderValidationError
 
+# Pre-parsed template: (literal text, field name, format spec, conversion)
+_Parts = Tuple[Tuple[str, Optional[str], str, Optional[str]], ...]
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+def _parse_template(template: str) -> _Parts:
+    """Split a str.format template into literal text and fields."""
+    return tuple(
+        (literal, field, spec or "", conversion)
+        for literal, field, spec, conversion in Formatter().parse(template)
+    )
+
+
+def _render(parts: _Parts, mapping: Mapping[str, Any]) -> str:
+    """Render a pre-parsed template, raising KeyError for missing fields."""
+    out = []
+    for literal, field, spec, conversion in parts:
+        out.append(literal)
+        if field is not None:
+            value = mapping[field]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            out.append(format(value, spec))
+    return "".join(out)
+
+
+# Templates are parsed once at import rather than on every generation
+_XML_PARTS = {mode: _parse_template(tpl) for mode, tpl in XML_TEMPLATES.items()}
+_LINE_PARTS = {mode: _parse_template(tpl) for mode, tpl in LINE_TEMPLATES.items()}
+
 
 class OrderXML:
     """Handles XML generation for different order types."""
 
+    # Order mode -> handler(mode, values, lines, config)
+    _DISPATCH = {
+        OrderMode.PICK_STANDARD: lambda m, v, l, c: OrderXML._generate_pick_order(
+            m, v, l
+        ),
+        OrderMode.PICK_MANUAL: lambda m, v, l, c: OrderXML._generate_pick_order(
+            m, v, l
+        ),
+        OrderMode.INVENTORY: lambda m, v, l, c: OrderXML._generate_inventory_order(v),
+        OrderMode.GOODS_IN: lambda m, v, l, c: OrderXML._generate_goods_in_order(v, c),
+        OrderMode.GOODS_ADD: lambda m, v, l, c: OrderXML._generate_goods_add_order(
+            v, c
+        ),
+        OrderMode.TRANSPORT: lambda m, v, l, c: OrderXML._generate_transport_order(
+            m, v, l
+        ),
+    }
+
     @staticmethod
     def generate(order_data: Dict[str, Any], config: Dict[str, Any]) -> str:
         """Generate XML for an order based on order data and configuration."""
@@ -23,16 +75,8 @@ class OrderXML:
             raise OrderValidationError("Order values are required")
 
         try:
-            if mode in [OrderMode.PICK_STANDARD, OrderMode.PICK_MANUAL]:
-                return OrderXML._generate_pick_order(mode, values, lines)
-            elif mode == OrderMode.INVENTORY:
-                return OrderXML._generate_inventory_order(values)
-            elif mode == OrderMode.GOODS_IN:
-                return OrderXML._generate_goods_in_order(values, config)
-            elif mode == OrderMode.GOODS_ADD:
-                return OrderXML._generate_goods_add_order(values, config)
-            elif mode == OrderMode.TRANSPORT:
-                return OrderXML._generate_transport_order(mode, values, lines)
+            handler = OrderXML._DISPATCH[mode]
+            return handler(mode, values, lines, config)
         except KeyError as e:
             raise OrderValidationError(f"Missing required field in order data: {e}")
         except Exception as e:
@@ -46,47 +90,45 @@ class OrderXML:
         if not values_list or not isinstance(values_list, list):
             raise OrderValidationError("Pick orders require a list of values")
 
-        lines_xml = ""
-        template = LINE_TEMPLATES[mode]
-
-        for values in values_list:
-            lines_xml += template.format(**values)
+        parts = _LINE_PARTS[mode]
+        lines_xml = "".join(_render(parts, values) for values in values_list)
 
-        order_values = values_list[0]
-        return XML_TEMPLATES[mode].format(lines=lines_xml, **order_values).strip()
+        overlay = ChainMap({"lines": lines_xml}, values_list[0])
+        return _render(_XML_PARTS[mode], overlay).strip()
 
     @staticmethod
     def _generate_inventory_order(values: Dict) -> str:
         """Generate XML for inventory orders."""
-        return XML_TEMPLATES[OrderMode.INVENTORY].format(**values).strip()
+        return _render(_XML_PARTS[OrderMode.INVENTORY], values).strip()
 
     @staticmethod
     def _generate_goods_in_order(values: Dict, config: Dict) -> str:
         """Generate XML for goods-in orders."""
-        values = values.copy()
-        values["cont_type"] = values.get("Container Type", "full")
-        capacity_specs = OrderXML._generate_capacity_specs(values, config)
-        values["capacity_specs"] = capacity_specs
-        return XML_TEMPLATES[OrderMode.GOODS_IN].format(**values).strip()
+        overlay = ChainMap(
+            {
+                "cont_type": values.get("Container Type", "full"),
+                "capacity_specs": OrderXML._generate_capacity_specs(values, config),
+            },
+            values,
+        )
+        return _render(_XML_PARTS[OrderMode.GOODS_IN], overlay).strip()
 
     @staticmethod
     def _generate_goods_add_order(values: Dict, config: Dict) -> str:
         """Generate XML for goods-add orders."""
-        capacity_specs = OrderXML._generate_capacity_specs(values, config)
-        values["capacity_specs"] = capacity_specs
-        return XML_TEMPLATES[OrderMode.GOODS_ADD].format(**values).strip()
+        overlay = ChainMap(
+            {"capacity_specs": OrderXML._generate_capacity_specs(values, config)},
+            values,
+        )
+        return _render(_XML_PARTS[OrderMode.GOODS_ADD], overlay).strip()
 
     @staticmethod
     def _generate_capacity_specs(values: Dict, config: Dict) -> str:
         """Generate capacity specifications XML from configuration."""
-        capacity_specs = ""
         config_capacity_specs = config.get("capacity_specs", {})
-
-        if config_capacity_specs:
-            for spec, max_qty in config_capacity_specs.items():
-                capacity_specs += f'<capacity_spec compartment_type="{spec}" maximum_quantity="{max_qty}"/>'
-
-        return capacity_specs
+        if not config_capacity_specs:
+            return ""
+        return _capacity_specs_xml(tuple(config_capacity_specs.items()))
 
     @staticmethod
     def _generate_transport_order(
@@ -96,12 +138,17 @@ class OrderXML:
         if not values_list or not isinstance(values_list, list):
             raise OrderValidationError("Transport orders require a list of values")
 
-        slot_contents_xml = ""
-        template = LINE_TEMPLATES[mode]
+        parts = _LINE_PARTS[mode]
+        slot_contents_xml = "".join(_render(parts, values) for values in values_list)
+
+        overlay = ChainMap({"slot_contents": slot_contents_xml}, values_list[0])
+        return _render(_XML_PARTS[mode], overlay).strip()
 
-        for values in values_list:
-            slot_contents_xml += template.format(**values)
 
-        order_values = values_list[0]
-        order_values["slot_contents"] = slot_contents_xml
-        return XML_TEMPLATES[mode].format(**order_values).strip()
+@lru_cache(maxsize=16)
+def _capacity_specs_xml(specs: Tuple[Tuple[str, Any], ...]) -> str:
+    """Build capacity spec elements, cached per set of specs."""
+    return "".join(
+        f'<capacity_spec compartment_type="{spec}" maximum_quantity="{max_qty}"/>'
+        for spec, max_qty in specs
+    )
@@ -1,6 +1,8 @@
 """Dialog components for user interaction."""
 
 import curses
+from collections import namedtuple
+from functools import lru_cache
 from typing import Optional, Any
 
 from .utils import (
@@ -9,8 +11,40 @@ from .utils import (
     truncate_text,
     draw_border,
     show_status,
+    hline,
+    blanks,
+    update_screen,
+    ATTR,
 )
-from config.constants import Colors, Symbols
+from config.constants import Colors
+
+# Message type -> (ATTR key, symbol, label)
+_TYPE_CONFIG = {
+    "error": ("error_bold", "X", "Error"),
+    "success": ("success_bold", "✓", "Success"),
+    "warning": ("warning_bold", "!", "Warning"),
+    "info": ("info_bold", "i", "Information"),
+    "question": ("info_bold", "?", "Question"),
+}
+
+_MessageLayout = namedtuple("_MessageLayout", "lines width height y x")
+
+
+@lru_cache(maxsize=64)
+def _layout_message(width: int, height: int, message: str) -> _MessageLayout:
+    """Compute the message box geometry for a screen size and message."""
+    lines = tuple(message.split("\n"))
+    max_line_length = max(len(line) for line in lines) if lines else 0
+    message_width = min(width - 10, max(max_line_length + 10, 50))
+    message_height = len(lines) + 8
+
+    return _MessageLayout(
+        lines,
+        message_width,
+        message_height,
+        (height - message_height) // 2,
+        (width - message_width) // 2,
+    )
 
 
 def display_dialog(
@@ -22,25 +56,17 @@ def display_dialog(
 ) -> Optional[bool]:
     """Display enhanced message dialog and wait for acknowledgment."""
     height, width = get_screen_size(stdscr)
-    stdscr.clear()
+    stdscr.erase()
 
-    lines = message.split("\n")
-    max_line_length = max(len(line) for line in lines) if lines else 0
-    message_width = min(width - 10, max(max_line_length + 10, 50))
-    message_height = len(lines) + 8
+    layout = _layout_message(width, height, message)
+    lines = layout.lines
+    message_width = layout.width
+    message_height = layout.height
+    y_start = layout.y
+    x_start = layout.x
 
-    y_start = (height - message_height) // 2
-    x_start = (width - message_width) // 2
-
-    type_config = {
-        "error": (Colors.ERROR, "X", "Error"),
-        "success": (Colors.SUCCESS, "✓", "Success"),
-        "warning": (Colors.WARNING, "!", "Warning"),
-        "info": (Colors.INFO, "i", "Information"),
-        "question": (Colors.INFO, "?", "Question"),
-    }
-    color_pair, symbol, type_label = type_config.get(
-        message_type, (Colors.INFO, "i", "Information")
+    type_attr, symbol, type_label = _TYPE_CONFIG.get(
+        message_type, ("info_bold", "i", "Information")
     )
 
     # Draw enhanced message box
@@ -62,7 +88,7 @@ def display_dialog(
             y_start + 2,
             x_start + 2,
             type_indicator,
-            curses.color_pair(color_pair) | curses.A_BOLD,
+            ATTR[type_attr],
         )
 
         # Separator line
@@ -70,8 +96,8 @@ def display_dialog(
         stdscr.addstr(
             separator_y,
             x_start + 1,
-            Symbols.HORIZONTAL_LINE * (message_width - 2),
-            curses.color_pair(Colors.BORDER),
+            hline(message_width - 2),
+            ATTR["border"],
         )
 
         # Add message lines with better spacing
@@ -81,7 +107,7 @@ def display_dialog(
                 y_start + 5 + i,
                 x_start + 2,
                 line_text,
-                curses.color_pair(Colors.TEXT) | curses.A_NORMAL,
+                ATTR["text"],
             )
 
         # Enhanced instruction with visual prominence
@@ -94,12 +120,13 @@ def display_dialog(
             y_start + message_height - 2,
             x_start + 2,
             instruction_centered,
-            curses.color_pair(Colors.TEXT) | curses.A_BOLD,
+            ATTR["text_bold"],
         )
     except curses.error:
         pass
 
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    update_screen()
 
     # Handle user input
     if show_yes_no:
@@ -121,7 +148,7 @@ def prompt_input(
 ) -> Optional[Any]:
     """Enhanced user input dialog with better visual design."""
     height, width = get_screen_size(stdscr)
-    stdscr.clear()
+    stdscr.erase()
 
     dialog_width = min(width - 10, max(70, len(prompt) + 15))
     dialog_height = 10
@@ -133,6 +160,11 @@ def prompt_input(
         stdscr, dialog_y, dialog_x, dialog_height, dialog_width, title, Colors.HEADER
     )
 
+    # Enhanced input field with type indication
+    input_y = dialog_y + 5
+    input_x = dialog_x + 2
+    input_label = f"Value ({input_type.__name__}): "
+
     try:
         # Enhanced prompt display
         prompt_text = truncate_text(prompt, dialog_width - 4)
@@ -141,7 +173,7 @@ def prompt_input(
             dialog_y + 2,
             dialog_x + 2,
             prompt_centered,
-            curses.color_pair(Colors.INFO) | curses.A_BOLD,
+            ATTR["info_bold"],
         )
 
         # Separator line
@@ -149,19 +181,15 @@ def prompt_input(
         stdscr.addstr(
             separator_y,
             dialog_x + 1,
-            Symbols.HORIZONTAL_LINE * (dialog_width - 2),
-            curses.color_pair(Colors.BORDER),
+            hline(dialog_width - 2),
+            ATTR["border"],
         )
 
-        # Enhanced input field with type indication
-        input_y = dialog_y + 5
-        input_x = dialog_x + 2
-        input_label = f"Value ({input_type.__name__}): "
         stdscr.addstr(
             input_y,
             input_x,
             input_label,
-            curses.color_pair(Colors.TEXT) | curses.A_BOLD,
+            ATTR["text_bold"],
         )
 
         # Enhanced instructions
@@ -173,46 +201,52 @@ def prompt_input(
             dialog_y + 7,
             dialog_x + 2,
             instructions_centered,
-            curses.color_pair(Colors.TEXT) | curses.A_BOLD,
+            ATTR["text_bold"],
         )
     except curses.error:
         pass
 
-    stdscr.refresh()
-
-    # Get input with better UX
-    curses.echo()
-    curses.curs_set(1)
-    try:
-        user_input = (
-            stdscr.getstr(input_y, input_x + len(input_label), 40)
-            .decode("utf-8")
-            .strip()
-        )
-    except KeyboardInterrupt:
-        return None
-    finally:
-        curses.noecho()
-        curses.curs_set(0)
-
-    if not allow_empty and not user_input:
-        return None
+    # The dialog chrome never changes, so retries only clear the input field
+    while True:
+        try:
+            stdscr.addstr(input_y, input_x + len(input_label), blanks(40))
+        except curses.error:
+            pass
+        stdscr.noutrefresh()
+        update_screen()
 
-    # Handle type conversion with better error handling
-    if user_input and input_type != str:
+        # Get input with better UX
+        curses.echo()
+        curses.curs_set(1)
         try:
-            return input_type(user_input)
-        except (ValueError, TypeError):
-            # Show error message
-            display_dialog(
-                stdscr,
-                f"Invalid {input_type.__name__} value: '{user_input}'\nPlease enter a valid {input_type.__name__}.",
-                "Input Error",
-                "error",
+            user_input = (
+                stdscr.getstr(input_y, input_x + len(input_label), 40)
+                .decode("utf-8")
+                .strip()
             )
-            return prompt_input(stdscr, prompt, allow_empty, input_type)
+        except KeyboardInterrupt:
+            return None
+        finally:
+            curses.noecho()
+            curses.curs_set(0)
 
-    return user_input if user_input or allow_empty else None
+        if not allow_empty and not user_input:
+            return None
+
+        # Handle type conversion with better error handling
+        if user_input and input_type != str:
+            try:
+                return input_type(user_input)
+            except (ValueError, TypeError):
+                show_status(
+                    stdscr,
+                    f"Invalid {input_type.__name__} value: '{user_input}'. "
+                    f"Please enter a valid {input_type.__name__}.",
+                    "error",
+                )
+                continue
+
+        return user_input if user_input or allow_empty else None
 
 
 def process_keys(
@@ -220,58 +254,64 @@ def process_keys(
 ) -> Optional[Any]:
     """Enhanced input handler with type validation."""
     height, width = get_screen_size(stdscr)
+    stdscr.erase()
 
-    while True:
-        stdscr.clear()
-
-        dialog_width = min(width - 10, max(60, len(prompt) + 10))
-        dialog_height = 8
-        dialog_x = (width - dialog_width) // 2
-        dialog_y = (height - dialog_height) // 2
-
-        title = " Input Required "
-        draw_border(
-            stdscr,
-            dialog_y,
-            dialog_x,
-            dialog_height,
-            dialog_width,
-            title,
-            Colors.BORDER,
+    dialog_width = min(width - 10, max(60, len(prompt) + 10))
+    dialog_height = 8
+    dialog_x = (width - dialog_width) // 2
+    dialog_y = (height - dialog_height) // 2
+
+    title = " Input Required "
+    draw_border(
+        stdscr,
+        dialog_y,
+        dialog_x,
+        dialog_height,
+        dialog_width,
+        title,
+        Colors.BORDER,
+    )
+
+    # Input field
+    input_y = dialog_y + 4
+    input_x = dialog_x + 2
+    input_label = f"Value ({input_type.__name__}): "
+
+    try:
+        # Add prompt
+        prompt_text = truncate_text(prompt, dialog_width - 4)
+        prompt_centered = center_string(prompt_text, dialog_width - 4)
+        stdscr.addstr(
+            dialog_y + 2,
+            dialog_x + 2,
+            prompt_centered,
+            ATTR["header_bold"],
         )
 
-        try:
-            # Add prompt
-            prompt_text = truncate_text(prompt, dialog_width - 4)
-            prompt_centered = center_string(prompt_text, dialog_width - 4)
-            stdscr.addstr(
-                dialog_y + 2,
-                dialog_x + 2,
-                prompt_centered,
-                curses.color_pair(Colors.HEADER) | curses.A_BOLD,
-            )
+        stdscr.addstr(input_y, input_x, input_label, ATTR["text"])
 
-            # Input field
-            input_y = dialog_y + 4
-            input_x = dialog_x + 2
-            input_label = f"Value ({input_type.__name__}): "
-            stdscr.addstr(input_y, input_x, input_label, curses.color_pair(Colors.TEXT))
-
-            # Instructions
-            instructions = "Enter to confirm • Ctrl+C to cancel"
-            if allow_empty:
-                instructions += " • Leave empty for default"
-            instructions_centered = center_string(instructions, dialog_width - 4)
-            stdscr.addstr(
-                dialog_y + 6,
-                dialog_x + 2,
-                instructions_centered,
-                curses.color_pair(Colors.INFO) | curses.A_DIM,
-            )
+        # Instructions
+        instructions = "Enter to confirm • Ctrl+C to cancel"
+        if allow_empty:
+            instructions += " • Leave empty for default"
+        instructions_centered = center_string(instructions, dialog_width - 4)
+        stdscr.addstr(
+            dialog_y + 6,
+            dialog_x + 2,
+            instructions_centered,
+            ATTR["info_dim"],
+        )
+    except curses.error:
+        pass
+
+    # The dialog chrome never changes, so retries only clear the input field
+    while True:
+        try:
+            stdscr.addstr(input_y, input_x + len(input_label), blanks(20))
         except curses.error:
             pass
-
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        update_screen()
 
         # Get input
         curses.echo()
@@ -290,7 +330,8 @@ def process_keys(
 
         if not allow_empty and not user_input:
             show_status(stdscr, "Input cannot be empty!", "error")
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            update_screen()
             stdscr.getch()
             continue
 
@@ -305,5 +346,6 @@ def process_keys(
                 f"Invalid {input_type.__name__} value! Please try again.",
                 "error",
             )
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            update_screen()
             stdscr.getch()
@@ -2,17 +2,69 @@
 
 import curses
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Tuple
 
 from .utils import (
     get_screen_size,
     center_string,
     truncate_text,
+    truncate_to_width,
+    middle_truncate,
+    display_width,
     draw_border,
     show_status,
+    hline,
+    blanks,
+    update_screen,
+    read_nav_delta,
+    drain_resizes,
+    ATTR,
+    ENTER_KEYS,
+    BACK_KEYS,
+    SAVE_KEYS,
+    LOOKUP_KEYS,
 )
 from .menu import display_menu
-from config.constants import Colors, Symbols
+from .dialog import display_dialog
+from config.constants import (
+    Colors,
+    Symbols,
+    TRANSPORT_PROCESSING_MODES,
+    TRANSPORT_MODE_DESCRIPTIONS,
+)
+
+try:
+    from models.config import Config
+    from models.database import Database
+    from controllers.config_controller import ConfigController
+except ImportError:
+    Config = Database = ConfigController = None
+
+# The form also edits a field with vi-style l and goes back with h
+_FORM_ENTER_KEYS = ENTER_KEYS | {ord("l")}
+_FORM_BACK_KEYS = BACK_KEYS | {ord("h")}
+# Seconds a transient status message stays in the status bar
+_STATUS_SECONDS = 2.0
+# Seconds the resolved OSR ID is reused between database lookups
+_OSRID_TTL = 30
+# Spinner frames shown while a lookup query runs
+_SPINNER = "|/-\\"
+# Returned by _fetch_with_spinner when the user presses Escape
+_CANCELLED = object()
+# Worker thread that runs lookup queries off the UI thread
+_executor = None
+# Config manager shared by all lookups
+_config_manager = None
+# Footer hint for each field that supports a database lookup
+_DB_LOOKUP_FIELDS = {
+    "Container Type": "Database lookup: Container types",
+    "Product Code": "Database lookup: Product codes and names",
+    "Product Name": "Database lookup: Product codes and names",
+    "Processing Mode": "Select processing mode",
+}
+# Resolved OSR ID and when it was read, plus Database handles per OSR ID
+_DB_CACHE = {"osrid": None, "time": 0.0, "dbs": {}}
 
 
 def edit_form(
@@ -24,299 +76,385 @@ def edit_form(
 ) -> Optional[Dict[str, Any]]:
     """Enhanced field editing with improved visual design and dynamic sizing."""
     current_row = 0
+    previous_row = None
+    pad_top = 0
+    full_redraw = True
+    # Transient (message, status_type, expiry) shown instead of the default
+    status = None
     height, width = get_screen_size(stdscr)
 
-    while True:
-        stdscr.clear()
+    # Field names never change; value strings are refreshed per edit
+    max_field_len = max(map(len, fields)) if fields else 20
+    value_strs, max_value_len = _value_strings(fields, values)
+    field_nums = [f"{idx + 1:2d}" for idx in range(len(fields))]
+    is_transport_form = "Transport" in title
 
-        max_field_len = max(len(field) for field in fields) if fields else 20
-        max_value_len = (
-            max(len(str(values.get(field, ""))) for field in fields) if fields else 20
+    if enable_db_lookup:
+        instruction_text = (
+            "[S]end Order  •  [B]ack  •  [Enter] Edit Field  •  [D] Database Lookup"
         )
+    else:
+        instruction_text = "[S]end Order  •  [B]ack  •  [Enter] Edit Field"
 
-        if enable_db_lookup:
-            instruction_text = (
-                "[S]end Order  •  [B]ack  •  [Enter] Edit Field  •  [D] Database Lookup"
-            )
-        else:
-            instruction_text = "[S]end Order  •  [B]ack  •  [Enter] Edit Field"
-
-        content_width = max(
-            max_field_len + max_value_len + 20,
-            len(title) + 10,  # Title
-            len(instruction_text) + 10,  # Instructions
-        )
-
-        box_width = min(width - 6, max(70, content_width))
-        box_height = min(height - 4, len(fields) + 12)  # More space for better layout
-        box_x = (width - box_width) // 2
-        box_y = (height - box_height) // 2
-
-        # Draw main box with enhanced border
-        draw_border(stdscr, box_y, box_x, box_height, box_width, title, Colors.HEADER)
-
-        # Header section with improved spacing
-        try:
-            # Instructions with better visibility
-            instructions_y = box_y + 2
-            instruction_color = curses.color_pair(Colors.INFO) | curses.A_BOLD
-            instructions_centered = center_string(instruction_text, box_width - 4)
-            stdscr.addstr(
-                instructions_y, box_x + 2, instructions_centered, instruction_color
-            )
-
-            # Separator line for visual separation
-            separator_y = box_y + 3
-            stdscr.addstr(
-                separator_y,
-                box_x + 1,
-                Symbols.HORIZONTAL_LINE * (box_width - 2),
-                curses.color_pair(Colors.BORDER),
+    while True:
+        if full_redraw:
+            # Layout depends on the field values, so it is only recomputed
+            # after something may have changed them
+            stdscr.erase()
+            painted_hint = painted_status = None
+
+            content_width = max(
+                max_field_len + max_value_len + 20,
+                len(title) + 10,  # Title
+                len(instruction_text) + 10,  # Instructions
             )
-        except curses.error:
-            pass
-
-        # Enhanced field display section
-        field_start_y = box_y + 5  # More space after header
-        for idx, field in enumerate(fields):
-            y_pos = field_start_y + idx
-            if y_pos >= box_y + box_height - 5:  # Leave more space for footer
-                break
 
-            value = str(values.get(field, ""))
-
-            # Enhanced field formatting with better visual hierarchy
-            field_num = f"{idx + 1:2d}"
-            field_name = field
-
-            # Calculate available space more intelligently
+            box_width = min(width - 6, max(70, content_width))
+            box_height = min(height - 4, len(fields) + 12)  # More space for layout
+            box_x = (width - box_width) // 2
+            box_y = (height - box_height) // 2
+            field_start_y = box_y + 5  # More space after header
+            footer_start_y = box_y + box_height - 4
+            prompt_y = box_y + box_height - 2
+            # Left edge and width of the box contents
+            inner_x = box_x + 2
+            inner_width = box_width - 4
+
+            # Field labels and value columns only depend on the box width
             field_section_width = (box_width - 8) // 2
             value_section_width = box_width - field_section_width - 12
+            field_displays = [
+                truncate_to_width(field, field_section_width - 5) for field in fields
+            ]
+            value_displays = [
+                _value_display(value, value_section_width) for value in value_strs
+            ]
+
+            # Draw main box with enhanced border
+            draw_border(
+                stdscr, box_y, box_x, box_height, box_width, title, Colors.HEADER
+            )
 
-            field_display = truncate_text(field_name, field_section_width - 5)
-            value_display = truncate_text(value, value_section_width) if value else "─"
-
-            if idx == current_row:
-                # Enhanced highlighting for selected field
-                try:
-                    # Selection indicator with number
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 2,
-                        f"{Symbols.ARROW_RIGHT}",
-                        curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
-                    )
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 4,
-                        field_num,
-                        curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
-                    )
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 7,
-                        f". {field_display}:",
-                        curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
-                    )
-                    # Value with different color for better contrast
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 11 + len(field_display),  # Added more spacing
-                        f" {value_display}",  # Added space before value
-                        curses.color_pair(Colors.WARNING) | curses.A_BOLD,
-                    )
-                except curses.error:
-                    pass
-            else:
-                # Normal field display with improved readability
-                try:
-                    # Field number in subdued color
-                    stdscr.addstr(
-                        y_pos, box_x + 4, field_num, curses.color_pair(Colors.INFO)
-                    )
-                    # Field name
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 7,
-                        f". {field_display}:",
-                        curses.color_pair(Colors.TEXT),
-                    )
-                    # Value with slight emphasis
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 11 + len(field_display),  # Added more spacing
-                        f" {value_display}",  # Added space before value
-                        curses.color_pair(Colors.HEADER),
-                    )
-                except curses.error:
-                    pass
+            # Header section with improved spacing
+            try:
+                # Instructions with better visibility
+                instruction_color = ATTR["info_bold"]
+                instructions_centered = center_string(instruction_text, box_width - 4)
+                stdscr.addstr(
+                    box_y + 2, box_x + 2, instructions_centered, instruction_color
+                )
 
-        # Enhanced footer section with better spacing and visibility
-        footer_start_y = box_y + box_height - 4
+                # Separator line for visual separation
+                stdscr.addstr(
+                    box_y + 3,
+                    box_x + 1,
+                    hline(box_width - 2),
+                    ATTR["border"],
+                )
 
-        # Separator line before footer
-        try:
-            stdscr.addstr(
-                footer_start_y - 1,
-                box_x + 1,
-                Symbols.HORIZONTAL_LINE * (box_width - 2),
-                curses.color_pair(Colors.BORDER),
-            )
-        except curses.error:
-            pass
+                # Separator line before footer
+                stdscr.addstr(
+                    footer_start_y - 1,
+                    box_x + 1,
+                    hline(box_width - 2),
+                    ATTR["border"],
+                )
+            except curses.error:
+                pass
+
+            # Field rows live in a pad that is scrolled into the box, so
+            # navigation only has to redraw the rows that changed
+            visible_rows = footer_start_y - 1 - field_start_y  # Leave footer space
+            # Don't leave blank rows below the pad if the box got taller
+            pad_top = min(pad_top, max(0, len(fields) - visible_rows))
+            pad_bottom = field_start_y + visible_rows - 1
+            pad_right = box_x + box_width - 3
+            pad = curses.newpad(max(len(fields), 1), box_width - 4)
+            pad.leaveok(True)
+            for idx in range(len(fields)):
+                _draw_field_row(
+                    pad,
+                    idx,
+                    box_width,
+                    field_nums[idx],
+                    field_displays[idx],
+                    value_displays[idx],
+                    idx == current_row,
+                )
+            full_redraw = False
+        elif previous_row != current_row:
+            # Only the old and new highlighted rows change on navigation
+            for idx in (previous_row, current_row):
+                _draw_field_row(
+                    pad,
+                    idx,
+                    box_width,
+                    field_nums[idx],
+                    field_displays[idx],
+                    value_displays[idx],
+                    idx == current_row,
+                )
+        previous_row = current_row
 
-        # Enhanced database indicator with better positioning
-        if enable_db_lookup and current_row < len(fields):
-            field = fields[current_row]
-            # Define which fields support database lookup
-            db_lookup_fields = {
-                "Container Type": "Database lookup: Container types",
-                "Product Code": "Database lookup: Product codes and names",
-                "Product Name": "Database lookup: Product codes and names",
-                "Processing Mode": "Select processing mode",
-            }
-
-            if field in db_lookup_fields:
-                # Special handling for Processing Mode in transport orders
-                if field == "Processing Mode" and "Transport" in title:
-                    db_indicator = (
-                        "Press [Enter] to select processing mode (standard pre-filled)"
-                    )
-                else:
-                    db_indicator = (
-                        f"[D] {db_lookup_fields[field]} • [Enter] Edit manually"
-                    )
+        # Keep the selected row inside the visible part of the pad
+        if current_row < pad_top:
+            pad_top = current_row
+        elif current_row >= pad_top + visible_rows:
+            pad_top = current_row - visible_rows + 1
 
-                db_indicator_truncated = truncate_text(db_indicator, box_width - 4)
-                try:
-                    stdscr.addstr(
-                        footer_start_y,
-                        box_x + 2,
-                        db_indicator_truncated,
-                        curses.color_pair(Colors.INFO) | curses.A_DIM,
-                    )
-                except curses.error:
-                    pass
-                except curses.error:
-                    pass
+        # The footer hint and status bar are only repainted when their text
+        # changes, which for plain navigation is usually neither
+        hint = ""
+        if enable_db_lookup and current_row < len(fields):
+            hint = _lookup_hint(fields[current_row], is_transport_form, inner_width)
+        if hint != painted_hint:
+            try:
+                stdscr.addstr(footer_start_y, inner_x, blanks(inner_width))
+                if hint:
+                    stdscr.addstr(footer_start_y, inner_x, hint, ATTR["info_dim"])
+            except curses.error:
+                pass
+            painted_hint = hint
 
         # Status bar
-        show_status(stdscr, f"Editing field: {fields[current_row]}", "info")
-        stdscr.refresh()
-
+        if status is not None and time.monotonic() >= status[2]:
+            status = None
+        if status is not None:
+            status_line = status[:2]
+        else:
+            status_line = (f"Editing field: {fields[current_row]}", "info")
+        if status_line != painted_status:
+            show_status(stdscr, *status_line)
+            painted_status = status_line
+
+        # The cursor is hidden, so don't spend output moving it after drawing
+        stdscr.leaveok(True)
+        stdscr.noutrefresh()
+        if visible_rows > 0:
+            pad.noutrefresh(pad_top, 0, field_start_y, inner_x, pad_bottom, pad_right)
+        update_screen()
+        stdscr.leaveok(False)
+
+        # Wake up when a transient status expires instead of sleeping on it
+        if status is not None:
+            stdscr.timeout(max(1, int((status[2] - time.monotonic()) * 1000)))
         key = stdscr.getch()
-
-        if key in (curses.KEY_UP, ord("k")) and current_row > 0:
-            current_row -= 1
-        elif key in (curses.KEY_DOWN, ord("j")) and current_row < len(fields) - 1:
-            current_row += 1
-        elif key == ord("s") or key == ord("S"):
+        stdscr.timeout(-1)
+        if key == -1:
+            continue
+
+        delta = read_nav_delta(stdscr, key)
+        if key == curses.KEY_RESIZE:
+            drain_resizes()
+            # The size is only re-read when the terminal reports a change
+            height, width = get_screen_size(stdscr)
+            full_redraw = True
+        elif delta is not None:
+            current_row = max(0, min(current_row + delta, len(fields) - 1))
+        elif key in SAVE_KEYS:
             show_status(stdscr, "Saving configuration...", "success")
-            stdscr.refresh()
-            time.sleep(0.5)
+            stdscr.noutrefresh()
+            update_screen()
             return values
-        elif key in (ord("b"), ord("B"), ord("h")):
+        elif key in _FORM_BACK_KEYS:
             return None
-        elif key in (ord("d"), ord("D")) and enable_db_lookup:
+        elif key in LOOKUP_KEYS and enable_db_lookup:
             # Handle database lookup
             field = fields[current_row]
             # Disable D key for Processing Mode in transport orders
-            if field == "Processing Mode" and "Transport" in title:
-                show_status(
-                    stdscr,
+            if field == "Processing Mode" and is_transport_form:
+                status = (
                     "Use [Enter] to select processing mode for transport orders",
                     "info",
+                    time.monotonic() + _STATUS_SECONDS,
                 )
-                stdscr.refresh()
-                time.sleep(1.5)
             else:
-                _handle_database_lookup(stdscr, field, values)
-        elif key in (curses.KEY_ENTER, 10, 13, ord("l")):  # Enter
+                result = _handle_database_lookup(stdscr, field, values)
+                if result is not None:
+                    status = result + (time.monotonic() + _STATUS_SECONDS,)
+                value_strs, max_value_len = _value_strings(fields, values)
+                # The lookup's menus handle resizes themselves, so the form
+                # never sees the KEY_RESIZE
+                height, width = get_screen_size(stdscr)
+                full_redraw = True
+        elif key in _FORM_ENTER_KEYS:
             field_name = fields[current_row]
 
             # Special handling for Processing Mode field
             if field_name == "Processing Mode":
-                _handle_processing_mode_selection(stdscr, values)
+                result = _handle_processing_mode_selection(stdscr, values)
+                if result is not None:
+                    status = result + (time.monotonic() + _STATUS_SECONDS,)
+                value_strs, max_value_len = _value_strings(fields, values)
+                height, width = get_screen_size(stdscr)
+                full_redraw = True
                 continue
 
-            current_value = str(values.get(field_name, ""))
+            new_value = _prompt_edit(
+                stdscr,
+                prompt_y,
+                inner_x,
+                inner_width,
+                field_name,
+                value_strs[current_row],
+            )
+            painted_status = None  # The prompt used the status bar
+            if new_value is None:
+                status = (
+                    "Edit cancelled",
+                    "warning",
+                    time.monotonic() + _STATUS_SECONDS,
+                )
+                continue
 
-            # Show input prompt
-            show_status(stdscr, f"Editing {field_name} - Enter new value:", "info")
-            stdscr.refresh()
+            values[field_name] = new_value  # Empty values are allowed
+            value_strs[current_row] = new_value
+            if len(new_value) > max_value_len:
+                # A longer value may widen the box
+                max_value_len = len(new_value)
+                full_redraw = True
+            else:
+                value_displays[current_row] = _value_display(
+                    new_value, value_section_width
+                )
+                _draw_field_row(
+                    pad,
+                    current_row,
+                    box_width,
+                    field_nums[current_row],
+                    field_displays[current_row],
+                    value_displays[current_row],
+                    True,
+                )
+            status = (
+                f"Updated {field_name}",
+                "success",
+                time.monotonic() + _STATUS_SECONDS,
+            )
 
-            # Enable input
-            curses.curs_set(1)
-            curses.echo()
 
-            try:
-                prompt_y = box_y + box_height - 2
-                prompt_x = box_x + 2
+def _prompt_edit(
+    stdscr, y: int, x: int, width: int, field_name: str, current_value: str
+) -> Optional[str]:
+    """Prompt for a new field value on a single row of the form.
 
-                # Clear input area
-                stdscr.addstr(
-                    prompt_y,
-                    prompt_x,
-                    " " * (box_width - 4),
-                    curses.color_pair(Colors.TEXT),
-                )
-                stdscr.addstr(
-                    prompt_y,
-                    prompt_x,
-                    f"{field_name}: ",
-                    curses.color_pair(Colors.TEXT),
-                )
-                stdscr.addstr(
-                    prompt_y,
-                    prompt_x + len(field_name) + 2,
-                    current_value,
-                    curses.A_REVERSE,
-                )
-                stdscr.move(
-                    prompt_y, prompt_x + len(field_name) + 2 + len(current_value)
-                )
-                stdscr.refresh()
+    Returns the entered value, or None if the edit was interrupted.
+    """
+    # Show input prompt
+    show_status(stdscr, f"Editing {field_name} - Enter new value:", "info")
 
-                # Get user input
-                new_value = (
-                    stdscr.getstr(prompt_y, prompt_x + len(field_name) + 2, 40)
-                    .decode("utf-8")
-                    .strip()
-                )
+    # Enable input
+    curses.curs_set(1)
+    curses.echo()
+
+    input_x = x + len(field_name) + 2
+
+    try:
+        # Clear input area
+        stdscr.addstr(y, x, blanks(width), ATTR["text"])
+        stdscr.addstr(y, x, f"{field_name}: ", ATTR["text"])
+        stdscr.addstr(y, input_x, current_value, curses.A_REVERSE)
+        stdscr.move(y, input_x + len(current_value))
+        stdscr.noutrefresh()
+        update_screen()
+
+        # Get user input
+        return stdscr.getstr(y, input_x, 40).decode("utf-8").strip()
+    except KeyboardInterrupt:
+        return None
+    finally:
+        curses.noecho()
+        curses.curs_set(0)
+        try:
+            stdscr.addstr(y, x, blanks(width))
+        except curses.error:
+            pass
 
-                if new_value or new_value == "":  # Allow empty values
-                    values[field_name] = new_value
-                    show_status(stdscr, f"Updated {field_name}", "success")
-                    stdscr.refresh()
-                    time.sleep(0.3)
 
-            except KeyboardInterrupt:
-                show_status(stdscr, "Edit cancelled", "warning")
-                stdscr.refresh()
-                time.sleep(0.3)
-            finally:
-                curses.noecho()
-                curses.curs_set(0)
+def _lookup_hint(field: str, is_transport_form: bool, width: int) -> str:
+    """Get the footer hint for a field that supports a database lookup."""
+    if field not in _DB_LOOKUP_FIELDS:
+        return ""
+    # Special handling for Processing Mode in transport orders
+    if field == "Processing Mode" and is_transport_form:
+        hint = "Press [Enter] to select processing mode (standard pre-filled)"
+    else:
+        hint = f"[D] {_DB_LOOKUP_FIELDS[field]} • [Enter] Edit manually"
+    return truncate_text(hint, width)
+
+
+def _value_strings(fields: List[str], values: Dict[str, Any]) -> tuple:
+    """Get the display string of each field value and the longest length."""
+    value_strs = [str(values.get(field, "")) for field in fields]
+    max_value_len = max(map(len, value_strs)) if fields else 20
+    return value_strs, max_value_len
+
+
+def _value_display(value: str, width: int) -> str:
+    """Get the text shown in the value column for a field value."""
+    # Cut long values in the middle so both ends stay distinguishable
+    return middle_truncate(value, width) if value else "─"
+
+
+def _draw_field_row(
+    win,
+    y_pos: int,
+    box_width: int,
+    field_num: str,
+    field_display: str,
+    value_display: str,
+    selected: bool,
+) -> None:
+    """Draw a single field row of the edit form into the field pad."""
+    # Draw the whole row in one call, then recolor the number and value
+    marker = Symbols.ARROW_RIGHT if selected else " "
+    row = f"{marker} {field_num} . {field_display}:  {value_display}"
+    # Columns rather than characters, as values may contain wide characters
+    value_x = 9 + display_width(field_display)  # Value starts with a space
+    value_width = display_width(value_display)
+    if selected:
+        # Enhanced highlighting for selected field
+        row_attr = num_attr = ATTR["selected_bold"]
+        value_attr = ATTR["warning_bold"]
+    else:
+        # Field number subdued, value with slight emphasis
+        row_attr, num_attr, value_attr = ATTR["text"], ATTR["info"], ATTR["header"]
 
+    try:
+        win.addstr(
+            y_pos, 0, row + blanks(box_width - 5 - value_x - value_width), row_attr
+        )
+    except curses.error:
+        pass  # Filling the pad's last cell leaves the cursor outside it
+    try:
+        if num_attr != row_attr:
+            win.chgat(y_pos, 2, len(field_num), num_attr)
+        win.chgat(y_pos, value_x, value_width + 1, value_attr)
+    except curses.error:
+        pass
 
-def _handle_database_lookup(stdscr, field: str, values: Dict[str, Any]) -> None:
-    """Handle database lookups for specific fields."""
-    from models.database import Database
-    from models.config import Config
 
+def _handle_database_lookup(
+    stdscr, field: str, values: Dict[str, Any]
+) -> Optional[Tuple[str, str]]:
+    """Handle database lookups for specific fields.
+
+    Returns a (message, status_type) pair to show in the status bar, if any.
+    """
     # Special handling for Processing Mode field
     if field == "Processing Mode":
-        _handle_processing_mode_selection(stdscr, values)
-        return
+        return _handle_processing_mode_selection(stdscr, values)
+
+    if Database is None:
+        return ("Database lookup is not available", "error")
 
     try:
-        config_manager = Config()
-        config = config_manager.load()
-        osrid = config_manager.resolve_osr(config)
+        osrid = _cached_osrid()
 
         # Check if OSR ID is configured, if not prompt to configure it
         if not osrid:
-            from ui.dialog import display_dialog
+            config_manager = _get_config()
+            config = config_manager.load()
 
             # Ask user if they want to configure OSR ID now
             dialog_result = display_dialog(
@@ -328,33 +466,27 @@ def _handle_database_lookup(stdscr, field: str, values: Dict[str, Any]) -> None:
             )
 
             if dialog_result:  # User chose Yes
-                from controllers.config_controller import ConfigController
-
                 config_controller = ConfigController()
                 config_controller.configure_osr_id(stdscr, config, config_manager)
 
                 # Reload config to get the new OSR ID
-                config = config_manager.load()
-                osrid = config_manager.resolve_osr(config)
+                _DB_CACHE["osrid"] = None
+                osrid = _cached_osrid()
 
                 if not osrid:
-                    show_status(stdscr, "OSR ID configuration cancelled", "warning")
-                    stdscr.refresh()
-                    time.sleep(2)
-                    return
+                    return ("OSR ID configuration cancelled", "warning")
             else:
-                show_status(
-                    stdscr, "Database access requires OSR ID configuration", "info"
-                )
-                stdscr.refresh()
-                time.sleep(2)
-                return
+                return ("Database access requires OSR ID configuration", "info")
 
-        db = Database(osrid)
+        db = _DB_CACHE["dbs"].get(osrid)
+        if db is None:
+            db = _DB_CACHE["dbs"][osrid] = Database(osrid)
 
         if field == "Container Type":
             try:
-                container_types = db.get_container_types()
+                container_types = _fetch_with_spinner(stdscr, db.get_container_types)
+                if container_types is _CANCELLED:
+                    return ("Lookup cancelled", "warning")
                 if container_types:
                     options = [ct[0] for ct in container_types]
                     selected_idx = display_menu(
@@ -366,19 +498,15 @@ def _handle_database_lookup(stdscr, field: str, values: Dict[str, Any]) -> None:
                     if selected_idx is not None:
                         values[field] = options[selected_idx]
                 else:
-                    show_status(
-                        stdscr, "No container types found in database", "warning"
-                    )
-                    stdscr.refresh()
-                    time.sleep(2)
+                    return ("No container types found in database", "warning")
             except Exception as e:
-                show_status(stdscr, f"Database error: {str(e)}", "error")
-                stdscr.refresh()
-                time.sleep(2)
+                return (f"Database error: {str(e)}", "error")
 
         elif field in ["Product Code", "Product Name"]:
             try:
-                products = db.get_products_for_goods_in()  # Using the combined method
+                products = _fetch_with_spinner(stdscr, db.get_products_for_goods_in)
+                if products is _CANCELLED:
+                    return ("Lookup cancelled", "warning")
                 if products:
                     # Create display options showing both name and code
                     options = [f"{prod[0]} ({prod[1]})" for prod in products]
@@ -393,28 +521,82 @@ def _handle_database_lookup(stdscr, field: str, values: Dict[str, Any]) -> None:
                         values["Product Name"] = selected_product[0]
                         values["Product Code"] = selected_product[1]
                 else:
-                    show_status(stdscr, "No products found in database", "warning")
-                    stdscr.refresh()
-                    time.sleep(2)
+                    return ("No products found in database", "warning")
             except Exception as e:
-                show_status(stdscr, f"Database error: {str(e)}", "error")
-                stdscr.refresh()
-                time.sleep(2)
+                return (f"Database error: {str(e)}", "error")
         else:
-            show_status(stdscr, f"No database lookup available for {field}", "info")
-            stdscr.refresh()
-            time.sleep(1.5)
+            return (f"No database lookup available for {field}", "info")
 
     except Exception as e:
-        show_status(stdscr, f"Database connection error: {str(e)}", "error")
-        stdscr.refresh()
-        time.sleep(2)
+        return (f"Database connection error: {str(e)}", "error")
+
+
+def _fetch_with_spinner(stdscr, query):
+    """Run a database query in the background while animating the status bar.
+
+    Returns the query result, or _CANCELLED if the user pressed Escape.
+    Exceptions raised by the query are re-raised here.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-lookup")
+
+    future = _executor.submit(query)
+    frame = 0
+    polling = True
+    try:
+        while not future.done():
+            show_status(
+                stdscr,
+                f"Loading... {_SPINNER[frame % len(_SPINNER)]}  [Esc] Cancel",
+                "info",
+            )
+            stdscr.noutrefresh()
+            update_screen()
+            if polling:
+                stdscr.timeout(80)
+                key = stdscr.getch()
+                if key == 27:  # Escape
+                    return _CANCELLED
+                if key != -1:
+                    # Leave the key (a resize or type-ahead) for the form to
+                    # handle, and stop reading so it isn't picked up again
+                    curses.ungetch(key)
+                    polling = False
+            else:
+                wait((future,), timeout=0.08)
+            frame += 1
+    finally:
+        stdscr.timeout(-1)
+
+    return future.result()
+
+
+def _get_config():
+    """Get the Config manager shared by database lookups."""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = Config()
+    return _config_manager
+
+
+def _cached_osrid() -> str:
+    """Get the configured OSR ID, re-reading the config at most every TTL."""
+    now = time.monotonic()
+    if not _DB_CACHE["osrid"] or now - _DB_CACHE["time"] >= _OSRID_TTL:
+        config_manager = _get_config()
+        _DB_CACHE["osrid"] = config_manager.resolve_osr(config_manager.load())
+        _DB_CACHE["time"] = now
+    return _DB_CACHE["osrid"]
 
 
-def _handle_processing_mode_selection(stdscr, values: Dict[str, Any]) -> None:
-    """Handle processing mode selection for transport orders."""
-    from config.constants import TRANSPORT_PROCESSING_MODES, TRANSPORT_MODE_DESCRIPTIONS
+def _handle_processing_mode_selection(
+    stdscr, values: Dict[str, Any]
+) -> Optional[Tuple[str, str]]:
+    """Handle processing mode selection for transport orders.
 
+    Returns a (message, status_type) pair to show in the status bar, if any.
+    """
     # Create user-friendly options with descriptions
     options = []
     current_mode = values.get("Processing Mode", "standard")
@@ -443,6 +625,4 @@ def _handle_processing_mode_selection(stdscr, values: Dict[str, Any]) -> None:
     if selected_idx is not None:
         selected_mode = TRANSPORT_PROCESSING_MODES[selected_idx]
         values["Processing Mode"] = selected_mode
-        show_status(stdscr, f"Processing mode set to: {selected_mode}", "success")
-        stdscr.refresh()
-        time.sleep(0.8)
+        return (f"Processing mode set to: {selected_mode}", "success")
@@ -9,9 +9,55 @@ from .utils import (
     truncate_text,
     draw_border,
     show_status,
+    hline,
+    update_screen,
+    read_nav_delta,
+    drain_resizes,
+    ATTR,
+    ENTER_KEYS,
+    DIGIT_KEYS,
+    BACK_KEYS,
+    REFRESH_KEYS,
+    QUIT_KEYS,
 )
 from config.constants import Colors, Symbols
 
+_NAV_INSTRUCTIONS = (
+    f"{Symbols.ARROW_UP}/{Symbols.ARROW_DOWN} Navigate • [0-9] Quick Select • "
+    "[Enter] Choose • [Q] Quit"
+)
+_MULTI_INSTRUCTIONS = "[Space] Toggle • [0-9] Quick Select • [Enter] Finish • [Q] Quit"
+# display_menu also chooses an option with vi-style l
+_MENU_ENTER_KEYS = ENTER_KEYS | {ord("l")}
+# Row prefixes for options 0-9, selected and not
+_SELECTED_PREFIXES = tuple(f"  {Symbols.ARROW_RIGHT} [{num}] " for num in range(10))
+_OPTION_PREFIXES = tuple(f"     [{num}] " for num in range(10))
+
+
+def _draw_option(
+    stdscr,
+    y_pos: int,
+    x: int,
+    width: int,
+    option_num: int,
+    option_text: str,
+    is_current: bool,
+) -> None:
+    """Draw a single menu option row over whatever was there before."""
+    # Draw the whole padded row in one call, then recolor the highlighted part
+    if is_current:
+        row = _SELECTED_PREFIXES[option_num] + option_text
+        highlight, highlight_attr = len(row), ATTR["selected_bold"]
+    else:
+        # Show number in different color for better visibility
+        row = _OPTION_PREFIXES[option_num] + option_text
+        highlight, highlight_attr = 8, ATTR["success"]
+    try:
+        stdscr.addnstr(y_pos, x, row.ljust(width), width, ATTR["text"])
+        stdscr.chgat(y_pos, x, min(highlight, width), highlight_attr)
+    except curses.error:
+        pass
+
 
 def display_sectioned_menu(
     stdscr,
@@ -36,147 +82,159 @@ def display_sectioned_menu(
     total_options = len(all_options)
     height, width = get_screen_size(stdscr)
 
+    # Content sizes don't change while the menu is open, only the screen does
+    max_option_len = max(len(opt) for opt in all_options) if all_options else 30
+    max_section_len = (
+        max(len(section) for section in sections.keys()) if sections else 20
+    )
+    sections_height = sum(
+        len(opts) + 2 for opts in sections.values()
+    )  # +2 for header and spacing
+    instructions = instructions or _NAV_INSTRUCTIONS
+
+    full_redraw = True
+    previous_row = current_row
+    # Screen row of each visible option, filled in by the full redraw
+    option_rows = {}
+
     while True:
-        stdscr.clear()
-
-        # Enhanced layout calculation
-        max_option_len = max(len(opt) for opt in all_options) if all_options else 30
-        max_section_len = (
-            max(len(section) for section in sections.keys()) if sections else 20
-        )
-
-        box_width = min(width - 6, max(80, max_option_len + 20, max_section_len + 15))
-        sections_height = sum(
-            len(opts) + 2 for opts in sections.values()
-        )  # +2 for header and spacing
-        box_height = min(height - 4, sections_height + 8)
-        box_x = (width - box_width) // 2
-        box_y = (height - box_height) // 2
-
-        # Draw main container with enhanced styling
-        draw_border(stdscr, box_y, box_x, box_height, box_width, title, Colors.HEADER)
-
-        # Display status info in header area
-        if status_info:
-            status_y = box_y + 1
-            status_text = center_string(status_info, box_width - 4)
-            try:
-                stdscr.addstr(
-                    status_y,
-                    box_x + 2,
-                    status_text,
-                    curses.color_pair(Colors.INFO) | curses.A_BOLD,
-                )
-            except curses.error:
-                pass
+        if not full_redraw:
+            for idx in (previous_row, current_row):
+                if idx in option_rows:
+                    _draw_option(
+                        stdscr,
+                        option_rows[idx],
+                        option_x,
+                        option_width,
+                        idx % 10,
+                        all_options[idx],
+                        idx == current_row,
+                    )
+        else:
+            stdscr.erase()
 
-        # Draw sections with enhanced styling
-        current_y = box_y + 3 + (1 if status_info else 0)
-        option_index = 0
+            # Enhanced layout calculation
+            box_width = min(
+                width - 6, max(80, max_option_len + 20, max_section_len + 15)
+            )
+            box_height = min(height - 4, sections_height + 8)
+            box_x = (width - box_width) // 2
+            box_y = (height - box_height) // 2
+            option_x = box_x + 2
+            option_width = box_width - 3
+            # Options and section headers stop above the instructions
+            rows_end_y = box_y + box_height - 3
+
+            # Draw main container with enhanced styling
+            draw_border(
+                stdscr, box_y, box_x, box_height, box_width, title, Colors.HEADER
+            )
 
-        for section_name, options in sections.items():
-            # Section header with your requested format
-            if current_y >= box_y + box_height - 3:
-                break
+            # Display status info in header area
+            if status_info:
+                status_y = box_y + 1
+                status_text = center_string(status_info, box_width - 4)
+                try:
+                    stdscr.addstr(
+                        status_y,
+                        box_x + 2,
+                        status_text,
+                        ATTR["info_bold"],
+                    )
+                except curses.error:
+                    pass
 
-            # Create the header in format: ╭─ Section Name -------------------------╮
-            header_text = f" {section_name} "
-            # Account for the border symbols and spacing: TOP_LEFT + " " + TOP_RIGHT + padding
-            available_width = (
-                box_width - 4 - len(header_text) - 2
-            )  # -2 for the TOP_LEFT and TOP_RIGHT symbols
-            padding_dashes = max(0, available_width)
-            section_header = f"{Symbols.TOP_LEFT}{Symbols.HORIZONTAL_LINE} {section_name} {Symbols.HORIZONTAL_LINE * padding_dashes}{Symbols.TOP_RIGHT}"
+            # Draw sections with enhanced styling
+            current_y = box_y + 3 + (1 if status_info else 0)
+            option_index = 0
+            option_rows.clear()
 
-            try:
-                stdscr.addstr(
-                    current_y,
-                    box_x + 2,
-                    section_header,
-                    curses.color_pair(Colors.SECTION_HEADER) | curses.A_BOLD,
-                )
-            except curses.error:
-                pass
-            current_y += 1
-
-            # Section options with enhanced visual design
-            for i, option in enumerate(options):
-                if current_y >= box_y + box_height - 3:
+            for section_name, options in sections.items():
+                # Section header with your requested format
+                if current_y >= rows_end_y:
                     break
 
-                # Prepare option text with numbering (0-9)
-                option_num = option_index % 10
-                if option_index == current_row:
-                    # Enhanced selection display
-                    display_text = f"  {Symbols.ARROW_RIGHT} [{option_num}] {option}"
-                    try:
-                        stdscr.addstr(
-                            current_y,
-                            box_x + 2,
-                            display_text,
-                            curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
-                        )
-                    except curses.error:
-                        pass
-                else:
-                    display_text = f"     [{option_num}] {option}"
-                    try:
-                        # Show number in different color for better visibility
-                        stdscr.addstr(
-                            current_y,
-                            box_x + 2,
-                            f"     [{option_num}]",
-                            curses.color_pair(Colors.SUCCESS),
-                        )
-                        stdscr.addstr(
-                            current_y,
-                            box_x + 2 + len(f"     [{option_num}]"),
-                            f" {option}",
-                            curses.color_pair(Colors.TEXT),
-                        )
-                    except curses.error:
-                        pass
+                # Create the header in format: ╭─ Section Name -------------------------╮
+                header_text = f" {section_name} "
+                # Account for the border symbols and spacing: TOP_LEFT + " " + TOP_RIGHT + padding
+                available_width = (
+                    box_width - 4 - len(header_text) - 2
+                )  # -2 for the TOP_LEFT and TOP_RIGHT symbols
+                padding_dashes = max(0, available_width)
+                section_header = f"{Symbols.TOP_LEFT}{Symbols.HORIZONTAL_LINE} {section_name} {hline(padding_dashes)}{Symbols.TOP_RIGHT}"
 
+                try:
+                    stdscr.addstr(
+                        current_y,
+                        box_x + 2,
+                        section_header,
+                        ATTR["section_header_bold"],
+                    )
+                except curses.error:
+                    pass
                 current_y += 1
-                option_index += 1
 
-            # Add spacing after section
-            current_y += 1
+                # Section options with enhanced visual design
+                for option in options:
+                    if current_y >= rows_end_y:
+                        break
+
+                    # Prepare option text with numbering (0-9)
+                    _draw_option(
+                        stdscr,
+                        current_y,
+                        option_x,
+                        option_width,
+                        option_index % 10,
+                        option,
+                        option_index == current_row,
+                    )
+                    option_rows[option_index] = current_y
+
+                    current_y += 1
+                    option_index += 1
+
+                # Add spacing after section
+                current_y += 1
 
-        # Enhanced instructions with custom support
-        instructions_y = box_y + box_height - 2
-        if instructions:
+            # Enhanced instructions with custom support
+            instructions_y = box_y + box_height - 2
             instructions_text = center_string(instructions, box_width - 4)
-        else:
-            instructions_text = center_string(
-                f"{Symbols.ARROW_UP}/{Symbols.ARROW_DOWN} Navigate • [0-9] Quick Select • [Enter] Choose • [Q] Quit",
-                box_width - 4,
-            )
-        try:
-            stdscr.addstr(
-                instructions_y,
-                box_x + 2,
-                instructions_text,
-                curses.color_pair(Colors.TEXT) | curses.A_BOLD,
-            )
-        except curses.error:
-            pass
+            try:
+                stdscr.addstr(
+                    instructions_y,
+                    box_x + 2,
+                    instructions_text,
+                    ATTR["text_bold"],
+                )
+            except curses.error:
+                pass
+
+            full_redraw = False
+        previous_row = current_row
 
-        stdscr.refresh()
+        # The cursor is hidden, so don't spend output moving it after drawing
+        stdscr.leaveok(True)
+        stdscr.noutrefresh()
+        update_screen()
+        stdscr.leaveok(False)
         key = stdscr.getch()
 
         # Navigation
-        if key in (curses.KEY_UP, ord("k")) and current_row > 0:
-            current_row -= 1
-        elif key in (curses.KEY_DOWN, ord("j")) and current_row < total_options - 1:
-            current_row += 1
-        elif key in (curses.KEY_ENTER, 10, 13):
+        delta = read_nav_delta(stdscr, key)
+        if key == curses.KEY_RESIZE:
+            drain_resizes()
+            height, width = get_screen_size(stdscr)
+            full_redraw = True
+        elif delta is not None:
+            current_row = max(0, min(current_row + delta, total_options - 1))
+        elif key in ENTER_KEYS:
             return current_row
-        elif key >= ord("0") and key <= ord("9"):
-            num = key - ord("0")
+        elif key in DIGIT_KEYS:
+            num = DIGIT_KEYS[key]
             if num < total_options:
                 return num
-        elif key in (ord("q"), ord("Q")):
+        elif key in QUIT_KEYS:
             return None
 
     return None
@@ -195,154 +253,172 @@ def display_menu(
     selected = set() if allow_multiple else None
     height, width = get_screen_size(stdscr)
 
+    full_redraw = True
+    previous_row = current_row
+    pad_top = 0
+    toggled = set()
+
     while True:
-        stdscr.clear()
-
-        # Calculate enhanced box dimensions
-        extra_width = 6 if allow_multiple else 0
-        max_option_len = max(len(option) for option in options) if options else 20
-        box_width = min(
-            width - 6,
-            max(70, max_option_len + 15 + extra_width),
-        )
-        box_height = min(height - 4, len(options) + 8)
-        box_x = (width - box_width) // 2
-        box_y = (height - box_height) // 2
-
-        # Draw main box with enhanced styling
-        draw_border(stdscr, box_y, box_x, box_height, box_width, title, Colors.HEADER)
-
-        # Draw menu options with enhanced design
-        option_start_y = box_y + 3
-        for idx, option in enumerate(options):
-            y_pos = option_start_y + idx
-            if y_pos >= box_y + box_height - 3:
-                break
-
-            # Prepare option text with enhanced styling
-            option_num = idx % 10  # Support 0-9 numbering
+        if full_redraw:
+            stdscr.erase()
+            painted_status = None
+
+            # Calculate enhanced box dimensions
+            extra_width = 6 if allow_multiple else 0
+            max_option_len = max(len(option) for option in options) if options else 20
+            box_width = min(
+                width - 6,
+                max(70, max_option_len + 15 + extra_width),
+            )
+            box_height = min(height - 4, len(options) + 8)
+            box_x = (width - box_width) // 2
+            box_y = (height - box_height) // 2
+            option_start_y = box_y + 3
+
+            # Option labels only depend on the box width
+            max_option_width = box_width - 12
             if allow_multiple:
-                checkbox = Symbols.BOX_CHECKED if idx in selected else Symbols.BOX_EMPTY
-                option_text = f"{checkbox} {option}"
+                plain_texts = [
+                    truncate_text(f"{Symbols.BOX_EMPTY} {option}", max_option_width)
+                    for option in options
+                ]
+                checked_texts = [
+                    truncate_text(f"{Symbols.BOX_CHECKED} {option}", max_option_width)
+                    for option in options
+                ]
             else:
-                option_text = f"{option}"
+                plain_texts = [
+                    truncate_text(option, max_option_width) for option in options
+                ]
 
-            # Truncate if too long
-            max_option_width = box_width - 12
-            option_text = truncate_text(option_text, max_option_width)
+            # Draw main box with enhanced styling
+            draw_border(
+                stdscr, box_y, box_x, box_height, box_width, title, Colors.HEADER
+            )
 
-            # Draw option with better visual hierarchy
-            if idx == current_row:
-                # Enhanced selection display
-                if allow_multiple:
-                    display_text = (
-                        f"  {Symbols.ARROW_RIGHT} [{option_num}] {option_text}"
-                    )
-                else:
-                    display_text = (
-                        f"  {Symbols.ARROW_RIGHT} [{option_num}] {option_text}"
-                    )
-                try:
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 2,
-                        display_text,
-                        curses.color_pair(Colors.SELECTED) | curses.A_BOLD,
-                    )
-                except curses.error:
-                    pass
+            # Draw enhanced instructions
+            instructions_y = box_y + box_height - 2
+            if allow_multiple:
+                instructions_text = center_string(
+                    _MULTI_INSTRUCTIONS,
+                    box_width - 4,
+                )
             else:
-                # Non-selected option with number highlighting
-                try:
-                    if allow_multiple:
-                        display_text = f"     [{option_num}] {option_text}"
-                    else:
-                        display_text = f"     [{option_num}] {option_text}"
-                    # Show number in different color
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 2,
-                        f"     [{option_num}]",
-                        curses.color_pair(Colors.SUCCESS),
-                    )
-                    stdscr.addstr(
-                        y_pos,
-                        box_x + 2 + len(f"     [{option_num}]"),
-                        f" {option_text}",
-                        curses.color_pair(Colors.TEXT),
-                    )
-                except curses.error:
-                    pass
+                instructions_text = center_string(
+                    _NAV_INSTRUCTIONS,
+                    box_width - 4,
+                )
+            try:
+                stdscr.addstr(
+                    instructions_y,
+                    box_x + 2,
+                    instructions_text,
+                    ATTR["text_bold"],
+                )
+            except curses.error:
+                pass
 
-        # Draw enhanced instructions
-        instructions_y = box_y + box_height - 2
-        if allow_multiple:
-            instructions_text = center_string(
-                f"[Space] Toggle • [0-9] Quick Select • [Enter] Finish • [Q] Quit",
-                box_width - 4,
-            )
+            # Options are drawn into an offscreen pad that is scrolled into
+            # the box; one spare column keeps the last cell writable
+            visible_rows = box_height - 6
+            # Don't leave blank rows below the pad if the box got taller
+            pad_top = min(pad_top, max(0, len(options) - visible_rows))
+            pad_bottom = option_start_y + visible_rows - 1
+            pad_right = box_x + box_width - 2
+            option_width = box_width - 3
+            pad = curses.newpad(max(len(options), 1), box_width - 2)
+            pad.leaveok(True)
+            rows = range(len(options))
+            full_redraw = False
         else:
-            instructions_text = center_string(
-                f"{Symbols.ARROW_UP}/{Symbols.ARROW_DOWN} Navigate • [0-9] Quick Select • [Enter] Choose • [Q] Quit",
-                box_width - 4,
-            )
-        try:
-            stdscr.addstr(
-                instructions_y,
-                box_x + 2,
-                instructions_text,
-                curses.color_pair(Colors.TEXT) | curses.A_BOLD,
+            # Only the rows whose selection or checkbox changed need repainting;
+            # an empty menu still has row 0 selected but nothing to draw
+            rows = [
+                idx
+                for idx in toggled | {previous_row, current_row}
+                if idx < len(options)
+            ]
+
+        for idx in rows:
+            if allow_multiple and idx in selected:
+                option_text = checked_texts[idx]
+            else:
+                option_text = plain_texts[idx]
+            _draw_option(
+                pad,
+                idx,
+                0,
+                option_width,
+                idx % 10,
+                option_text,
+                idx == current_row,
             )
-        except curses.error:
-            pass
+        toggled.clear()
+        previous_row = current_row
 
-        # Enhanced status bar
+        # Keep the selected option inside the visible part of the pad
+        if current_row < pad_top:
+            pad_top = current_row
+        elif current_row >= pad_top + visible_rows:
+            pad_top = current_row - visible_rows + 1
+
+        # Enhanced status bar, repainted only when its text changes
         if allow_multiple:
-            show_status(
-                stdscr,
-                f"Selected: {len(selected)} items • Use Space to toggle selection",
-                "info",
+            status_line = (
+                f"Selected: {len(selected)} items • Use Space to toggle selection"
             )
         else:
-            show_status(
-                stdscr,
-                "Navigate with arrow keys or number keys, Enter to select",
-                "info",
+            status_line = "Navigate with arrow keys or number keys, Enter to select"
+        if status_line != painted_status:
+            show_status(stdscr, status_line, "info")
+            painted_status = status_line
+
+        # The cursor is hidden, so don't spend output moving it after drawing
+        stdscr.leaveok(True)
+        stdscr.noutrefresh()
+        if visible_rows > 0:
+            pad.noutrefresh(
+                pad_top, 0, option_start_y, box_x + 2, pad_bottom, pad_right
             )
-
-        stdscr.refresh()
+        update_screen()
+        stdscr.leaveok(False)
 
         key = stdscr.getch()
 
         # Handle navigation
-        if key in (curses.KEY_UP, ord("k")) and current_row > 0:
-            current_row -= 1
-        elif key in (curses.KEY_DOWN, ord("j")) and current_row < len(options) - 1:
-            current_row += 1
+        delta = read_nav_delta(stdscr, key)
+        if key == curses.KEY_RESIZE:
+            drain_resizes()
+            height, width = get_screen_size(stdscr)
+            full_redraw = True
+        elif delta is not None:
+            current_row = max(0, min(current_row + delta, len(options) - 1))
         elif key == 32:  # Space for toggling in multi-select
             if allow_multiple:
                 if current_row in selected:
                     selected.remove(current_row)
                 else:
                     selected.add(current_row)
-        elif key in (curses.KEY_ENTER, 10, 13, ord("l")):  # Enter
+                toggled.add(current_row)
+        elif key in _MENU_ENTER_KEYS:
             if allow_multiple:
                 return list(selected)
             else:
                 return current_row
-        elif key >= ord("0") and key <= ord("9"):  # Number keys 0-9
-            num = key - ord("0")
+        elif key in DIGIT_KEYS:  # Number keys 0-9
+            num = DIGIT_KEYS[key]
             if num < len(options):
                 if allow_multiple:
                     if num in selected:
                         selected.remove(num)
                     else:
                         selected.add(num)
+                    toggled.add(num)
                 else:
                     return num
-        elif key == ord("r") or key == ord("R"):  # Refresh
+        elif key in REFRESH_KEYS:
             return -2
-        elif key == ord("b") or key == ord("B"):  # Back
+        elif key in BACK_KEYS:
             return -3
-        elif key == ord("q") or key == ord("Q"):
+        elif key in QUIT_KEYS:
             return list(selected) if allow_multiple else None
@@ -1,10 +1,44 @@
 """Basic UI utilities and helpers for curses interface."""
 
 import curses
-from typing import Tuple
+import os
+import unicodedata
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from config.constants import Colors, Symbols
 
+# Combined color pair and attribute values, filled in by init_attrs() when
+# setup_colors() runs
+ATTR = {}
+
+# Key bindings shared by the menus and forms, with vi-style alternatives
+NAV_UP_KEYS = frozenset((curses.KEY_UP, ord("k")))
+NAV_DOWN_KEYS = frozenset((curses.KEY_DOWN, ord("j")))
+ENTER_KEYS = frozenset((curses.KEY_ENTER, 10, 13))
+BACK_KEYS = frozenset((ord("b"), ord("B")))
+SAVE_KEYS = frozenset((ord("s"), ord("S")))
+LOOKUP_KEYS = frozenset((ord("d"), ord("D")))
+REFRESH_KEYS = frozenset((ord("r"), ord("R")))
+QUIT_KEYS = frozenset((ord("q"), ord("Q")))
+# Number keys mapped to the option index they select
+DIGIT_KEYS = {ord(str(digit)): digit for digit in range(10)}
+
+# Text that could not be written as-is, mapped to the form that worked
+_FALLBACK_TEXT = {}
+_FALLBACK_LIMIT = 256
+
+# DEC private mode 2026 (synchronized output), used when terminfo has no Sync
+_SYNC_MODE_ON = b"\x1b[?2026h"
+_SYNC_MODE_OFF = b"\x1b[?2026l"
+# Terminals known to implement mode 2026 whose terminfo entries don't list
+# Sync, matched on the start of TERM or on TERM_PROGRAM
+_SYNC_MODE_TERMS = ("xterm-kitty", "xterm-ghostty", "alacritty", "foot", "contour")
+_SYNC_MODE_PROGRAMS = frozenset(("WezTerm", "iTerm.app", "ghostty"))
+
+# East Asian width classes that take up two terminal columns
+_WIDE = frozenset(("W", "F"))
+
 
 def setup_colors() -> None:
     """Initialize curses color pairs."""
@@ -20,21 +54,124 @@ def setup_colors() -> None:
         curses.init_pair(Colors.BORDER, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
         curses.init_pair(Colors.INPUT_BG, curses.COLOR_BLACK, curses.COLOR_WHITE)
         curses.init_pair(Colors.SECTION_HEADER, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+    init_attrs()
+
+
+def init_attrs() -> None:
+    """Precompute the color pair and attribute combinations used by the UI.
+
+    Without color support the bold and dim attributes are still applied, and
+    the black-on-white pairs fall back to reverse video.
+    """
+    if curses.has_colors():
+        pair = curses.color_pair
+    else:
+
+        def pair(number: int) -> int:
+            if number in (Colors.SELECTED, Colors.INPUT_BG):
+                return curses.A_REVERSE
+            return curses.A_NORMAL
+
+    ATTR.update(
+        text=pair(Colors.TEXT),
+        text_bold=pair(Colors.TEXT) | curses.A_BOLD,
+        header=pair(Colors.HEADER),
+        header_bold=pair(Colors.HEADER) | curses.A_BOLD,
+        border=pair(Colors.BORDER),
+        info=pair(Colors.INFO),
+        info_bold=pair(Colors.INFO) | curses.A_BOLD,
+        info_dim=pair(Colors.INFO) | curses.A_DIM,
+        selected_bold=pair(Colors.SELECTED) | curses.A_BOLD,
+        success=pair(Colors.SUCCESS),
+        success_bold=pair(Colors.SUCCESS) | curses.A_BOLD,
+        warning_bold=pair(Colors.WARNING) | curses.A_BOLD,
+        error_bold=pair(Colors.ERROR) | curses.A_BOLD,
+        section_header_bold=pair(Colors.SECTION_HEADER) | curses.A_BOLD,
+        input_bg=pair(Colors.INPUT_BG),
+    )
 
 
 def write_text(stdscr, y: int, x: int, text: str, attr: int = 0) -> None:
     """Safely add string to screen with encoding fallbacks."""
+    safe_text = _FALLBACK_TEXT.get(text)
+    if safe_text is not None:
+        # This text already needed a fallback; skip the failing attempts
+        try:
+            stdscr.addstr(y, x, safe_text, attr)
+        except curses.error:
+            pass
+        return
+
     try:
         stdscr.addstr(y, x, text, attr)
+        return
     except (UnicodeEncodeError, curses.error):
+        pass
+
+    for codec in ("latin1", "ascii"):
+        safe_text = text.encode(codec, "replace").decode(codec)
         try:
-            stdscr.addstr(y, x, text.encode("latin1", "replace").decode("latin1"), attr)
+            stdscr.addstr(y, x, safe_text, attr)
         except (UnicodeEncodeError, curses.error):
-            try:
-                safe_text = text.encode("ascii", "replace").decode("ascii")
-                stdscr.addstr(y, x, safe_text, attr)
-            except curses.error:
-                pass
+            continue
+        if safe_text != text:
+            if len(_FALLBACK_TEXT) >= _FALLBACK_LIMIT:
+                _FALLBACK_TEXT.clear()
+            _FALLBACK_TEXT[text] = safe_text
+        return
+
+
+def read_nav_delta(stdscr, key: int) -> Optional[int]:
+    """Fold a navigation key and any already queued after it into one move.
+
+    Returns the net number of rows to move, or None if key is not a
+    navigation key. Held-down or pasted arrow keys are drained without
+    blocking so the caller renders once for the whole run; the first
+    non-navigation key is pushed back for the next getch().
+    """
+    if key not in NAV_UP_KEYS and key not in NAV_DOWN_KEYS:
+        return None
+
+    delta = 0
+    stdscr.nodelay(True)
+    try:
+        while key != -1:
+            if key in NAV_UP_KEYS:
+                delta -= 1
+            elif key in NAV_DOWN_KEYS:
+                delta += 1
+            else:
+                curses.ungetch(key)
+                break
+            key = stdscr.getch()
+    finally:
+        stdscr.nodelay(False)
+    return delta
+
+
+@lru_cache(maxsize=1)
+def _input_pad():
+    """Get a 1x1 pad for reading queued keys without touching the screen."""
+    pad = curses.newpad(1, 1)
+    pad.keypad(True)
+    pad.nodelay(True)
+    return pad
+
+
+def drain_resizes() -> None:
+    """Discard KEY_RESIZE events queued behind the one being handled.
+
+    Dragging a terminal edge reports a resize for every step; only the
+    final size matters, so the caller lays out once for the whole burst.
+    Keys are read through a pad because getch() on stdscr would first
+    repaint it at the new size.
+    """
+    pad = _input_pad()
+    key = pad.getch()
+    while key == curses.KEY_RESIZE:
+        key = pad.getch()
+    if key != -1:
+        curses.ungetch(key)
 
 
 def get_screen_size(stdscr) -> Tuple[int, int]:
@@ -46,6 +183,19 @@ def get_screen_size(stdscr) -> Tuple[int, int]:
         return 24, 80
 
 
+@lru_cache(maxsize=32)
+def hline(width: int) -> str:
+    """Get a horizontal line of the given width."""
+    return Symbols.HORIZONTAL_LINE * width
+
+
+@lru_cache(maxsize=32)
+def blanks(width: int) -> str:
+    """Get a run of spaces of the given width, for clearing screen areas."""
+    return " " * width
+
+
+@lru_cache(maxsize=256)
 def center_string(text: str, width: int) -> str:
     """Center text within a given width."""
     if len(text) >= width:
@@ -56,11 +206,83 @@ def center_string(text: str, width: int) -> str:
 
 def truncate_text(text: str, max_width: int, suffix: str = "...") -> str:
     """Truncate text to fit within max_width."""
+    # Most text already fits, so skip the cache lookup for it
     if len(text) <= max_width:
         return text
+    return _truncate(text, max_width, suffix)
+
+
+@lru_cache(maxsize=256)
+def _truncate(text: str, max_width: int, suffix: str) -> str:
+    """Cut text down to max_width characters, ending with suffix."""
+    if max_width <= len(suffix):
+        return text[: max(max_width, 0)]
     return text[: max_width - len(suffix)] + suffix
 
 
+def _char_width(char: str) -> int:
+    """Get the number of terminal columns a single character takes up."""
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in _WIDE else 1
+
+
+@lru_cache(maxsize=512)
+def display_width(text: str) -> int:
+    """Get the number of terminal columns text takes up."""
+    return sum(map(_char_width, text))
+
+
+def _fitting_chars(text: str, limit: int) -> int:
+    """Count how many leading characters of text fit within limit columns."""
+    used = 0
+    for count, char in enumerate(text):
+        used += _char_width(char)
+        if used > limit:
+            return count
+    return len(text)
+
+
+def truncate_to_width(text: str, max_width: int, suffix: str = "...") -> str:
+    """Truncate text to fit within max_width terminal columns.
+
+    Unlike truncate_text this counts wide (e.g. CJK) characters as two
+    columns, for text such as database values that may contain them.
+    """
+    if display_width(text) <= max_width:
+        return text
+    if max_width <= len(suffix):
+        suffix = ""
+    return text[: _fitting_chars(text, max_width - len(suffix))] + suffix
+
+
+def middle_truncate(text: str, max_width: int, marker: str = "...") -> str:
+    """Truncate text to max_width terminal columns by cutting out its middle.
+
+    Keeps both the start and the end of the text visible, which is where
+    values like "Product Name (CODE)" carry the part that tells them apart.
+    """
+    if display_width(text) <= max_width:
+        return text
+    if max_width <= len(marker):
+        return truncate_to_width(text, max_width)
+
+    budget = max_width - len(marker)
+    left = _fitting_chars(text, budget - budget // 2)
+    right = _fitting_chars(text[::-1], budget - display_width(text[:left]))
+    return text[:left] + marker + text[len(text) - right :]
+
+
+@lru_cache(maxsize=32)
+def _border_rows(width: int) -> Tuple[str, str, str]:
+    """Get the top, side and bottom rows of a box of the given width."""
+    return (
+        Symbols.TOP_LEFT + hline(width - 2) + Symbols.TOP_RIGHT,
+        Symbols.VERTICAL_LINE + blanks(width - 2) + Symbols.VERTICAL_LINE,
+        Symbols.BOTTOM_LEFT + hline(width - 2) + Symbols.BOTTOM_RIGHT,
+    )
+
+
 def draw_border(
     stdscr,
     y: int,
@@ -71,72 +293,73 @@ def draw_border(
     color_pair: int = 0,
 ) -> None:
     """Draw a box with optional title using ASCII characters."""
-    # Draw borders
-    stdscr.addstr(y, x, Symbols.TOP_LEFT, curses.color_pair(color_pair))
-    stdscr.addstr(
-        y, x + 1, Symbols.HORIZONTAL_LINE * (width - 2), curses.color_pair(color_pair)
-    )
-    stdscr.addstr(y, x + width - 1, Symbols.TOP_RIGHT, curses.color_pair(color_pair))
+    top, middle, bottom = _border_rows(width)
+    attr = curses.color_pair(color_pair)
 
+    # Each row is a single write; side rows also blank the box interior
+    stdscr.addstr(y, x, top, attr)
     for i in range(1, height - 1):
-        stdscr.addstr(y + i, x, Symbols.VERTICAL_LINE, curses.color_pair(color_pair))
-        stdscr.addstr(
-            y + i, x + width - 1, Symbols.VERTICAL_LINE, curses.color_pair(color_pair)
-        )
-
-    stdscr.addstr(y + height - 1, x, Symbols.BOTTOM_LEFT, curses.color_pair(color_pair))
-    stdscr.addstr(
-        y + height - 1,
-        x + 1,
-        Symbols.HORIZONTAL_LINE * (width - 2),
-        curses.color_pair(color_pair),
-    )
-    stdscr.addstr(
-        y + height - 1,
-        x + width - 1,
-        Symbols.BOTTOM_RIGHT,
-        curses.color_pair(color_pair),
-    )
+        stdscr.addstr(y + i, x, middle, attr)
+    stdscr.addstr(y + height - 1, x, bottom, attr)
 
     # Add title if provided
     if title:
         title_text = f" {title} "
         if len(title_text) < width - 2:
             title_x = x + (width - len(title_text)) // 2
-            stdscr.addstr(
-                y, title_x, title_text, curses.color_pair(Colors.HEADER) | curses.A_BOLD
-            )
+            stdscr.addstr(y, title_x, title_text, ATTR["header_bold"])
+
+
+@lru_cache(maxsize=1)
+def _sync_sequences() -> Tuple[bytes, bytes]:
+    """Get the terminal's begin/end synchronized update sequences."""
+    try:
+        sync = curses.tigetstr("Sync")
+    except curses.error:
+        sync = None
+    if sync:
+        return curses.tparm(sync, 1), curses.tparm(sync, 2)
+
+    # Most terminfo entries don't list Sync yet even where the terminal
+    # supports it, so send the raw mode to terminals known to implement it
+    if os.environ.get("TERM", "").startswith(_SYNC_MODE_TERMS) or (
+        os.environ.get("TERM_PROGRAM") in _SYNC_MODE_PROGRAMS
+    ):
+        return _SYNC_MODE_ON, _SYNC_MODE_OFF
+    return b"", b""
+
+
+def update_screen() -> None:
+    """Send all pending window updates to the terminal as a single frame."""
+    begin, end = _sync_sequences()
+    if begin:
+        # Terminals that support it hold the frame until it is complete
+        curses.putp(begin)
+    curses.doupdate()
+    if end:
+        curses.putp(end)
+
+
+# Icon and ATTR key used for each status bar message type
+_STATUS_STYLES = {
+    "info": ("i", "info_bold"),
+    "success": ("✓", "success_bold"),
+    "error": ("✗", "error_bold"),
+    "warning": ("!", "warning_bold"),
+}
 
 
 def show_status(stdscr, message: str, status_type: str = "info") -> None:
     """Create status bar at bottom of screen."""
     height, width = get_screen_size(stdscr)
-    stdscr.move(height - 1, 0)
-    stdscr.clrtoeol()
-
-    color_map = {
-        "info": Colors.INFO,
-        "success": Colors.SUCCESS,
-        "error": Colors.ERROR,
-        "warning": Colors.WARNING,
-    }
-    color = color_map.get(status_type, Colors.INFO)
-
-    icon_map = {
-        "info": "i",
-        "success": "✓",
-        "error": "✗",
-        "warning": "!",
-    }
-    icon = icon_map.get(status_type, "?")
+    icon, attr_key = _STATUS_STYLES.get(status_type, ("?", "info_bold"))
 
     status_text = f" {icon} {message}"
     if len(status_text) > width:
         status_text = truncate_text(status_text, width)
 
+    # One padded write replaces the old text, so no separate clrtoeol()
     try:
-        stdscr.addstr(
-            height - 1, 0, status_text, curses.color_pair(color) | curses.A_BOLD
-        )
+        stdscr.addnstr(height - 1, 0, status_text.ljust(width), width, ATTR[attr_key])
     except curses.error:
-        pass
+        pass  # Writing the bottom-right cell can't advance the cursor
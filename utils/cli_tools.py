@@ -7,89 +7,185 @@ system diagnostics, and build operations.
 
 import sys
 import os
-import json
-import shutil
-import subprocess
-import platform
-import socket
-from pathlib import Path
-from datetime import datetime, timedelta
+
+# Heavier standard library modules are imported by the commands that use
+# them, so each CLI option only pays for its own imports at startup
+
+# Suffixes of temporary files removed by clean_files(), including editor
+# backups ("~") and lock files ("#")
+_TEMP_SUFFIXES = (".pyc", ".pyo", ".pyd", "~", ".bak", ".swp", ".tmp", "#")
+# Cache directories removed by clean_files()
+_TEMP_DIRS = frozenset(("__pycache__", ".pytest_cache", ".coverage", "htmlcov"))
+# Directories handed to one rm/rd invocation
+_RMTREE_BATCH = 100
+# Sidecar next to the history log recording the result of the last cleanup
+_CLEANUP_STAMP_SUFFIX = ".cleanup"
+# Temporary file for the filtered log, kept apart from the ".tmp" file that
+# History.save() writes
+_FILTER_TMP_SUFFIX = ".filter.tmp"
+# Days of history kept by each --cleanup timeframe
+_CLEANUP_DAYS = {"1d": 1, "1w": 7, "2w": 14, "1m": 30}
 
 
 def test_imports():
     """Test module imports and return success status."""
-    print("Testing imports...")
+    import io
+
+    # Collect the report and write it out in one go at the end
+    out = io.StringIO()
+    print("Testing imports...", file=out)
 
     try:
-        print("  ✓ Config modules...", end=" ")
+        print("  ✓ Config modules...", end=" ", file=out)
         from config import constants, defaults
 
-        print("OK")
+        print("OK", file=out)
 
-        print("  ✓ UI modules...", end=" ")
+        print("  ✓ UI modules...", end=" ", file=out)
         from ui import utils, dialog, menu, form
 
-        print("OK")
+        print("OK", file=out)
 
-        print("  ✓ Model modules...", end=" ")
+        print("  ✓ Model modules...", end=" ", file=out)
         from models import config, database, history, order_sender, xml_generator
 
-        print("OK")
+        print("OK", file=out)
 
-        print("  ✓ Controller modules...", end=" ")
+        print("  ✓ Controller modules...", end=" ", file=out)
         from controllers import main_controller, order_controller, history_controller
 
-        print("OK")
+        print("OK", file=out)
 
-        print("  ✓ Utility modules...", end=" ")
+        print("  ✓ Utility modules...", end=" ", file=out)
         from utils import exceptions
 
-        print("OK")
+        print("OK", file=out)
 
-        print("\n✅ All imports successful!")
+        print("\n✅ All imports successful!", file=out)
         return True
 
     except ImportError as e:
-        print(f"\n❌ Import error: {e}")
+        print(f"\n❌ Import error: {e}", file=out)
         return False
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
+        print(f"\n❌ Unexpected error: {e}", file=out)
         return False
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
+def _filter_history(path, cutoff):
+    """Drop orders created before cutoff from the history log.
+
+    Returns the number of orders before and after filtering, and the
+    creation time of the oldest order kept (None if none are).
+    """
+    import json
+
+    # Stream the log into a new file one line at a time, copying the
+    # lines that are kept as they are
+    original_count = remaining_count = 0
+    oldest = None
+    kept_ids = set()
+    tmp_file = path + _FILTER_TMP_SUFFIX
+    with open(path, "rb") as src, open(tmp_file, "wb") as dst:
+        for line in src:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Drop blank lines and torn writes
+            if not line.endswith(b"\n"):
+                line += b"\n"
+
+            if entry.get("op") == "update":
+                # Status changes go with the order they belong to
+                if entry.get("order_id") in kept_ids:
+                    dst.write(line)
+                continue
+
+            original_count += 1
+            created = entry.get("created", "")
+            if created >= cutoff:
+                kept_ids.add(entry.get("order_id"))
+                dst.write(line)
+                remaining_count += 1
+                if oldest is None or created < oldest:
+                    oldest = created
+
+    if remaining_count < original_count:
+        os.replace(tmp_file, path)
+    else:
+        os.remove(tmp_file)
+    return original_count, remaining_count, oldest
+
+
+def _read_cleanup_stamp(path):
+    """Load the stamp left by the last cleanup, or None if there isn't one."""
+    import json
+
+    try:
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cleanup_stamp(path, history_file, remaining_count, oldest):
+    """Record the state of the history log after a cleanup."""
+    import json
+
+    st = os.stat(history_file)
+    stamp = {
+        "key": [st.st_mtime_ns, st.st_size],
+        "remaining": remaining_count,
+        "oldest": oldest,
+    }
+    tmp_file = path + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(stamp, f)
+    os.replace(tmp_file, path)
+
+
+def _clear_history(path):
+    """Empty the history log, returning how many orders it held."""
+    # Nothing is kept, so orders are counted without parsing any lines;
+    # History writes its status update events with "op" as the first key
+    with open(path, "r+b") as f:
+        original_count = sum(
+            1 for line in f if line.strip() and not line.startswith(b'{"op"')
+        )
+        if original_count:
+            f.seek(0)
+            f.truncate()
+    return original_count
 
 
 def cleanup_history(timeframe):
     """Clean up order history based on timeframe."""
+    from datetime import datetime, timedelta
+
     try:
         # Import constants to get the history file path
         from config.constants import ORDERS_HISTORY_FILE
 
         if not os.path.exists(ORDERS_HISTORY_FILE):
-            print("No order history file found. Nothing to clean.")
-            return True
+            # History from before the JSON Lines log is converted first
+            from models.history import History
 
-        # Load existing history
-        with open(ORDERS_HISTORY_FILE, "r") as f:
-            history = json.load(f)
+            History.migrate_legacy()
 
-        original_count = len(history.get("orders", []))
-
-        if original_count == 0:
-            print("Order history is already empty.")
+        if not os.path.exists(ORDERS_HISTORY_FILE):
+            print("No order history file found. Nothing to clean.")
             return True
 
         # Calculate cutoff date
         now = datetime.now()
 
         if timeframe == "all":
-            cutoff_date = now  # Remove everything
-        elif timeframe == "1d":
-            cutoff_date = now - timedelta(days=1)
-        elif timeframe == "1w":
-            cutoff_date = now - timedelta(weeks=1)
-        elif timeframe == "2w":
-            cutoff_date = now - timedelta(weeks=2)
-        elif timeframe == "1m":
-            cutoff_date = now - timedelta(days=30)
+            cutoff_date = None  # Remove everything
+        elif timeframe in _CLEANUP_DAYS:
+            cutoff_date = now - timedelta(days=_CLEANUP_DAYS[timeframe])
         else:
             try:
                 cutoff_date = datetime.strptime(timeframe, "%Y-%m-%d")
@@ -99,25 +195,43 @@ def cleanup_history(timeframe):
                 )
                 return False
 
-        if timeframe == "all":
-            filtered_orders = []
+        if cutoff_date is None:
+            original_count = _clear_history(ORDERS_HISTORY_FILE)
+            remaining_count = 0
         else:
-            filtered_orders = []
-            for order in history.get("orders", []):
-                order_time = datetime.fromisoformat(order.get("timestamp", ""))
-                if order_time >= cutoff_date:
-                    filtered_orders.append(order)
+            # Records carry a fixed-width "created" timestamp, so they can be
+            # compared as strings without parsing each one
+            cutoff = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
+
+            # If the log hasn't changed since the last cleanup and its oldest
+            # order is still inside the timeframe, there is nothing to remove
+            stamp_file = ORDERS_HISTORY_FILE + _CLEANUP_STAMP_SUFFIX
+            stamp = _read_cleanup_stamp(stamp_file)
+            st = os.stat(ORDERS_HISTORY_FILE)
+            if (
+                stamp is not None
+                and stamp.get("key") == [st.st_mtime_ns, st.st_size]
+                and (stamp.get("oldest") or "") >= cutoff
+            ):
+                original_count = remaining_count = stamp.get("remaining", 0)
+            else:
+                original_count, remaining_count, oldest = _filter_history(
+                    ORDERS_HISTORY_FILE, cutoff
+                )
+                _write_cleanup_stamp(
+                    stamp_file, ORDERS_HISTORY_FILE, remaining_count, oldest
+                )
 
-        history["orders"] = filtered_orders
-        removed_count = original_count - len(filtered_orders)
+        if original_count == 0:
+            print("Order history is already empty.")
+            return True
 
-        with open(ORDERS_HISTORY_FILE, "w") as f:
-            json.dump(history, f, indent=2)
+        removed_count = original_count - remaining_count
 
         print(f"Order History Cleanup Complete")
         print(f"Original orders: {original_count}")
         print(f"Removed: {removed_count}")
-        print(f"Remaining: {len(filtered_orders)}")
+        print(f"Remaining: {remaining_count}")
 
         if timeframe == "all":
             print("All order history has been cleared.")
@@ -136,6 +250,37 @@ def cleanup_history(timeframe):
         return False
 
 
+def _remove_trees(paths):
+    """Remove directory trees, returning {path: error} for any that failed.
+
+    Trees are removed by the platform's native tool in batches, which is
+    much faster than shutil.rmtree for large cache directories; whatever is
+    left afterwards is retried with shutil.rmtree to get a proper error.
+    """
+    import shutil
+    import subprocess
+
+    for start in range(0, len(paths), _RMTREE_BATCH):
+        batch = paths[start : start + _RMTREE_BATCH]
+        if os.name == "nt":
+            cmd = ["cmd", "/c", "rd", "/s", "/q"] + batch
+        else:
+            cmd = ["rm", "-rf", "--"] + batch
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            break  # No native tool; fall back to shutil.rmtree for the rest
+
+    failed = {}
+    for path in paths:
+        if os.path.lexists(path):
+            try:
+                shutil.rmtree(path)
+            except OSError as e:
+                failed[path] = e
+    return failed
+
+
 def clean_files():
     """Clean temporary files and cache directories."""
     print("🧹 Cleaning temporary files...")
@@ -143,34 +288,42 @@ def clean_files():
     removed_folders = []
     removed_files = []
 
-    temp_extensions = [".pyc", ".pyo", ".pyd", "~", ".bak", ".swp", ".tmp"]
-    temp_dirs = ["__pycache__", ".pytest_cache", ".coverage", "htmlcov"]
-
     script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-    for root, dirs, files in os.walk(script_dir, topdown=False):
-        for file in files:
-            file_path = os.path.join(root, file)
-
-            if (
-                any(file.endswith(ext) for ext in temp_extensions)
-                or file.startswith(".#")
-                or file.endswith("#")
-            ):
-                try:
-                    os.remove(file_path)
-                    removed_files.append(os.path.relpath(file_path, script_dir))
-                except OSError as e:
-                    print(f"⚠️  Failed to remove {file_path}: {e}")
-
-        for dir_name in dirs:
-            if dir_name in temp_dirs:
-                dir_path = os.path.join(root, dir_name)
-                try:
-                    shutil.rmtree(dir_path)
-                    removed_folders.append(os.path.relpath(dir_path, script_dir))
-                except OSError as e:
-                    print(f"⚠️  Failed to remove {dir_path}: {e}")
+    # Walk the tree with scandir so file types come from the directory
+    # listing itself rather than a stat() per entry
+    pending = [script_dir]
+    temp_paths = []
+    while pending:
+        try:
+            # Read the whole listing before removing anything from it
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"⚠️  Failed to read {e.filename}: {e}")
+            continue
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in _TEMP_DIRS:
+                    # Removed whole later, so there is no need to look inside
+                    temp_paths.append(entry.path)
+                else:
+                    pending.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                if entry.name.endswith(_TEMP_SUFFIXES) or entry.name.startswith(".#"):
+                    try:
+                        os.remove(entry.path)
+                        removed_files.append(os.path.relpath(entry.path, script_dir))
+                    except OSError as e:
+                        print(f"⚠️  Failed to remove {entry.path}: {e}")
+
+    failed = _remove_trees(temp_paths)
+    for dir_path in temp_paths:
+        if dir_path in failed:
+            print(f"⚠️  Failed to remove {dir_path}: {failed[dir_path]}")
+        else:
+            removed_folders.append(os.path.relpath(dir_path, script_dir))
 
     if removed_files or removed_folders:
         print(
@@ -182,11 +335,17 @@ def clean_files():
         return True
 
 
-def build_zipapp(output_file="order_gui.pyz"):
-    """Build zipapp package."""
+def build_zipapp(output_file="order_gui.pyz", clean=True):
+    """Build zipapp package, first cleaning the tree unless clean is False."""
+    import compileall
+    import shutil
+    import subprocess
+    import tempfile
+    from pathlib import Path
+
     print("📦 Building zipapp...")
 
-    if not clean_files():
+    if clean and not clean_files():
         return False
 
     current_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -200,21 +359,44 @@ def build_zipapp(output_file="order_gui.pyz"):
             print(f"❌ Failed to remove existing {output_file}: {e}")
             return False
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "zipapp",
-        str(current_dir),
-        "-o",
-        str(output_path),
-        "-p",
-        "/usr/bin/env python3",
-    ]
+    # Archive a staged copy of the tree: the output file can't end up inside
+    # its own archive, and temporary files, old builds and .git are left out
+    with tempfile.TemporaryDirectory() as stage:
+        source_dir = os.path.join(stage, current_dir.name)
+        shutil.copytree(
+            str(current_dir),
+            source_dir,
+            ignore=shutil.ignore_patterns(
+                ".git",
+                "*.pyz",
+                *_TEMP_DIRS,
+                *("*" + suffix for suffix in _TEMP_SUFFIXES),
+            ),
+        )
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+        # zipimport loads a module.pyc stored next to module.py, so the app
+        # starts without compiling its sources; other Python versions fall
+        # back to the .py files
+        compileall.compile_dir(source_dir, quiet=1, legacy=True)
+
+        cmd = [
+            sys.executable,
+            "-m",
+            "zipapp",
+            source_dir,
+            "-o",
+            str(output_path),
+            "-p",
+            "/usr/bin/env python3",
+            "-c",
+        ]
+
+        # Output is only decoded if it's going to be shown
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
     if result.returncode != 0:
-        print(f"❌ Zipapp creation failed: {result.stderr}")
+        errors = result.stderr.decode("utf-8", "replace")
+        print(f"❌ Zipapp creation failed: {errors}")
         return False
 
     if os.name != "nt":
@@ -224,7 +406,10 @@ def build_zipapp(output_file="order_gui.pyz"):
             pass
 
     test_cmd = [sys.executable, str(output_path), "--test-imports"]
-    test_result = subprocess.run(test_cmd, capture_output=True, text=True)
+    # --test-imports reports failures on stdout, so keep both streams
+    test_result = subprocess.run(
+        test_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
 
     if test_result.returncode == 0:
         file_size = os.path.getsize(output_path) / 1024
@@ -232,112 +417,159 @@ def build_zipapp(output_file="order_gui.pyz"):
         print(f"🚀 Run with: ./{output_file} or python3 {output_file}")
         return True
     else:
-        print(f"❌ Zipapp test failed: {test_result.stderr}")
+        output = test_result.stdout.decode("utf-8", "replace")
+        print(f"❌ Zipapp test failed: {output}")
         return False
 
 
-def test_system_connections():
-    """Test database and system connections."""
-    print("🔍 Testing system connections...")
-
-    connection_results = {"database": False, "corba": False, "overall": False}
+def _probe_database(out):
+    """Check the Oracle module and a database connection, reporting to out."""
+    from importlib.util import find_spec
 
+    ok = False
     try:
-        print("  📊 Testing Oracle database availability...", end=" ")
+        print("  📊 Testing Oracle database availability...", end=" ", file=out)
 
-        try:
-            import oracle
-
-            print("✅ Oracle module available")
+        # Look for the optional modules before importing anything, so a
+        # missing one costs a finder lookup rather than a failed import
+        if find_spec("oracle") is None:
+            print("❌ Oracle module not available", file=out)
+        else:
+            print("✅ Oracle module available", file=out)
 
             from models.database import Database
 
             test_osrid = "osr1"
             db = Database(test_osrid, retries=1, delay=1)
 
-            print("  📊 Testing database connection...", end=" ")
+            print("  📊 Testing database connection...", end=" ", file=out)
             try:
                 connection = db.connect()
                 if connection:
                     connection.close()
-                print("✅ Database connection successful")
-                connection_results["database"] = True
+                print("✅ Database connection successful", file=out)
+                ok = True
             except Exception as conn_e:
-                print(f"⚠️  Database connection failed: {conn_e}")
-
-        except ImportError:
-            print("❌ Oracle module not available")
+                print(f"⚠️  Database connection failed: {conn_e}", file=out)
 
     except ImportError as e:
-        print(f"❌ Database module import failed: {e}")
+        print(f"❌ Database module import failed: {e}", file=out)
     except Exception as e:
-        print(f"❌ Database test failed: {e}")
+        print(f"❌ Database test failed: {e}", file=out)
+
+    return ok
+
 
+def _probe_corba(out):
+    """Check the CORBA modules and ORB initialization, reporting to out."""
+    from importlib.util import find_spec
+
+    ok = False
     try:
-        print("  🔌 Testing CORBA ORB availability...", end=" ")
+        print("  🔌 Testing CORBA ORB availability...", end=" ", file=out)
 
-        from models.order_sender import CORBA_AVAILABLE
+        corba_available = False
+        if find_spec("omniORB") is not None:
+            from models.order_sender import CORBA_AVAILABLE as corba_available
 
-        if CORBA_AVAILABLE:
-            print("✅ CORBA modules available")
+        if corba_available:
+            print("✅ CORBA modules available", file=out)
 
-            print("  🔌 Testing CORBA ORB initialization...", end=" ")
+            print("  🔌 Testing CORBA ORB initialization...", end=" ", file=out)
             try:
                 from omniORB import CORBA
 
                 orb = CORBA.ORB_init([], CORBA.ORB_ID)
                 if orb:
-                    print("✅ CORBA ORB initialization successful")
-                    connection_results["corba"] = True
+                    print("✅ CORBA ORB initialization successful", file=out)
+                    ok = True
                 else:
-                    print("⚠️  CORBA ORB initialization failed")
+                    print("⚠️  CORBA ORB initialization failed", file=out)
 
             except Exception as orb_e:
-                print(f"⚠️  CORBA ORB test failed: {orb_e}")
+                print(f"⚠️  CORBA ORB test failed: {orb_e}", file=out)
         else:
-            print("❌ CORBA modules not available")
+            print("❌ CORBA modules not available", file=out)
 
     except ImportError as e:
-        print(f"❌ CORBA module import failed: {e}")
+        print(f"❌ CORBA module import failed: {e}", file=out)
     except Exception as e:
-        print(f"❌ CORBA test failed: {e}")
+        print(f"❌ CORBA test failed: {e}", file=out)
+
+    return ok
+
+
+def _probe_network(out):
+    """Check that the local hostname resolves, reporting to out."""
+    import socket
 
     try:
-        print("  🌐 Testing network connectivity...", end=" ")
+        print("  🌐 Testing network connectivity...", end=" ", file=out)
         socket.gethostbyname(socket.gethostname())
-        print("✅ Network connectivity OK")
+        print("✅ Network connectivity OK", file=out)
+        return True
 
     except Exception as e:
-        print(f"⚠️  Network connectivity issue: {e}")
+        print(f"⚠️  Network connectivity issue: {e}", file=out)
+        return False
+
+
+def test_system_connections():
+    """Test database and system connections."""
+    import io
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("🔍 Testing system connections...")
+
+    connection_results = {"database": False, "corba": False, "overall": False}
+
+    # The probes mostly wait on connections and lookups, so run them side by
+    # side and print their reports in a fixed order once all have finished
+    probes = (_probe_database, _probe_corba, _probe_network)
+    reports = [io.StringIO() for _ in probes]
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = [pool.submit(probe, out) for probe, out in zip(probes, reports)]
+        results = [future.result() for future in futures]
+
+    # The rest of the report is collected and written out in one go
+    out = io.StringIO()
+    for report in reports:
+        out.write(report.getvalue())
+    connection_results["database"], connection_results["corba"], _ = results
 
     try:
-        print("  🌍 Checking environment variables...", end=" ")
+        print("  🌍 Checking environment variables...", end=" ", file=out)
 
         required_env_vars = ["PATH"]
         optional_env_vars = ["OSR_ID", "ORACLE_HOME", "LD_LIBRARY_PATH"]
 
         missing_required = [var for var in required_env_vars if not os.environ.get(var)]
         if missing_required:
-            print(f"❌ Missing required env vars: {missing_required}")
+            print(f"❌ Missing required env vars: {missing_required}", file=out)
         else:
-            print("✅ Required environment variables OK")
+            print("✅ Required environment variables OK", file=out)
 
         for var in optional_env_vars:
             value = os.environ.get(var)
             if value:
-                print(f"    ✓ {var}: {value[:50]}{'...' if len(value) > 50 else ''}")
+                print(
+                    f"    ✓ {var}: {value[:50]}{'...' if len(value) > 50 else ''}",
+                    file=out,
+                )
             else:
-                print(f"    - {var}: Not set")
+                print(f"    - {var}: Not set", file=out)
 
     except Exception as e:
-        print(f"❌ Environment variable check failed: {e}")
+        print(f"❌ Environment variable check failed: {e}", file=out)
 
-    print("\n📋 Connection Test Summary:")
+    print("\n📋 Connection Test Summary:", file=out)
     print(
-        f"  Database: {'✅ Ready' if connection_results['database'] else '❌ Not available'}"
+        f"  Database: {'✅ Ready' if connection_results['database'] else '❌ Not available'}",
+        file=out,
     )
     print(
-        f"  CORBA:    {'✅ Ready' if connection_results['corba'] else '❌ Not available'}"
+        f"  CORBA:    {'✅ Ready' if connection_results['corba'] else '❌ Not available'}",
+        file=out,
     )
 
     connection_results["overall"] = (
@@ -346,37 +578,49 @@ def test_system_connections():
 
     if connection_results["overall"]:
         print(
-            "✅ System connection test completed - At least one connection type is available"
+            "✅ System connection test completed - At least one connection type is available",
+            file=out,
         )
     else:
         print(
-            "⚠️  System connection test completed - No connections are fully available"
+            "⚠️  System connection test completed - No connections are fully available",
+            file=out,
         )
-        print("   Note: This may be expected in development environments")
+        print("   Note: This may be expected in development environments", file=out)
 
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
     return connection_results["overall"]
 
 
 def show_server_info():
     """Display server and environment information."""
+    import platform
+    import socket
+
     print("🖥️  Server Information")
     print("=" * 50)
 
-    print(f"Hostname: {socket.gethostname()}")
-    print(f"Platform: {platform.system()} {platform.release()}")
-    print(f"Architecture: {platform.machine()}")
+    # One uname() result serves the hostname and every platform field
+    uname = platform.uname()
+    print(f"Hostname: {uname.node or socket.gethostname()}")
+    print(f"Platform: {uname.system} {uname.release}")
+    print(f"Architecture: {uname.machine}")
     print(f"Python: {platform.python_version()}")
     print(f"Python Path: {sys.executable}")
     print(f"Working Directory: {os.getcwd()}")
 
     print("\n📁 Configuration Files:")
-    config_files = [".orders_config.json", ".order_history.json"]
+    from config.constants import CONFIG_FILE, ORDERS_HISTORY_FILE
 
-    for config_file in config_files:
-        if os.path.exists(config_file):
-            size = os.path.getsize(config_file)
-            print(f"  ✅ {config_file} ({size} bytes)")
+    for config_file in (CONFIG_FILE, ORDERS_HISTORY_FILE):
+        name = os.path.basename(config_file)
+        # A single stat() both checks that the file exists and gets its size
+        try:
+            size = os.stat(config_file).st_size
+        except OSError:
+            print(f"  ❌ {name} (not found)")
         else:
-            print(f"  ❌ {config_file} (not found)")
+            print(f"  ✅ {name} ({size} bytes)")
 
     return True
@@ -4,28 +4,28 @@
 class OrderGUIException(Exception):
     """Base exception for Order GUI operations."""
 
-    pass
+    __slots__ = ()
 
 
 class DatabaseConnectionError(OrderGUIException):
     """Raised when database connection fails."""
 
-    pass
+    __slots__ = ()
 
 
 class ORBConnectionError(OrderGUIException):
     """Raised when CORBA ORB connection fails."""
 
-    pass
+    __slots__ = ()
 
 
 class OrderValidationError(OrderGUIException):
     """Raised when order validation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(OrderGUIException):
     """Raised when configuration is invalid or missing."""
 
-    pass
+    __slots__ = ()